@@ -1,4 +1,9 @@
 # Check for required dependencies
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
 from functools import wraps
 
 try:
@@ -17,9 +22,9 @@ except ImportError:
         "Install it using 'pip install weaviate'."
     )
 
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Sequence, Union
 
-from flask import Flask, current_app, has_app_context, g
+from flask import Flask, Response, current_app, has_app_context, g, request
 from weaviate import WeaviateClient
 from weaviate.auth import (
     AuthApiKey,
@@ -35,6 +40,58 @@ from weaviate.connect import ConnectionParams
 from weaviate.embedded import EmbeddedOptions
 from weaviate.exceptions import WeaviateStartUpError
 
+from flask_weaviate.bulkhead import Bulkhead, BulkheadFullError  # noqa: F401
+from flask_weaviate.fan_out import (  # noqa: F401
+    FUSION_METHODS,
+    FanOutResult,
+    FusedObject,
+    reciprocal_rank_fusion,
+    score_fusion,
+)
+from flask_weaviate.greenlet import (
+    SharedClientPool,
+    detect_monkey_patching,
+    init_grpc_gevent,
+)
+from flask_weaviate.init_checks import ServerMetaCache, bind_key, server_meta_cache  # noqa: F401
+from flask_weaviate.multi_query import QueryOutcome, QuerySpec
+from flask_weaviate.pagination import (  # noqa: F401
+    InvalidCursorError,
+    Page,
+    dump_cursor,
+    load_cursor,
+    next_url,
+)
+from flask_weaviate.retry import (  # noqa: F401
+    RetryBudget,
+    RetryPolicy,
+    WeaviateConnectError,
+    is_transient,
+)
+from flask_weaviate.serialization import (  # noqa: F401
+    VECTOR_MODES,
+    dumps,
+    encode_vector,
+    result_to_dict,
+    to_response,
+)
+from flask_weaviate.tokens import (  # noqa: F401
+    OidcTokenSource,
+    TokenCache,
+    TokenUnavailableError,
+    credentials_key,
+    token_cache,
+)
+from flask_weaviate.timing import (
+    get_timings,
+    is_measuring,
+    log_slow_query,
+    measuring,
+    record_timing,
+    server_timing_header,
+)
+from flask_weaviate.transport import instrument_client, run_until
+
 
 class FlaskWeaviate(object):
     """
@@ -81,6 +138,40 @@ class FlaskWeaviate(object):
     :type additional_config: AdditionalConfig | None
     :param skip_init_checks: Skip Weaviate client initialization checks.
     :type skip_init_checks: bool
+    :param retry_policy: Retry policy for idempotent operations.
+    :type retry_policy: RetryPolicy | None
+    :param server_timing: Add a `Server-Timing` header with the time spent
+    in Weaviate to every response.
+    :type server_timing: bool
+    :param slow_query_threshold: Log Weaviate calls taking longer than
+    this many seconds to the `flask_weaviate.slow_query` logger.
+    :type slow_query_threshold: float | None
+    :param log_query_values: Log the strings passed to slow calls as they
+    are instead of redacted to their length and hash.
+    :type log_query_values: bool
+    :param max_workers: Size of the thread pool used for concurrent queries.
+    :type max_workers: int
+    :param max_concurrent_calls: Maximum number of Weaviate calls in flight,
+    including calls made on the client directly, None for no limit.
+    :type max_concurrent_calls: int | None
+    :param max_queue_wait: Seconds a call waits for a free slot before
+    failing with a BulkheadFullError (503).
+    :type max_queue_wait: float
+    :param greenlet_mode: Share a pool of clients between greenlets instead
+    of a client per app context. None detects gevent or eventlet monkey
+    patching.
+    :type greenlet_mode: bool | None
+    :param pool_size: Number of clients shared in greenlet mode.
+    :type pool_size: int
+    :param init_checks_ttl: Seconds the result of the client init checks is
+    cached per server, so later clients skip them. 0 disables the cache.
+    :type init_checks_ttl: float
+    :param share_tokens: Fetch OIDC tokens for username/password and client
+    credentials auth once per process and share them between clients.
+    :type share_tokens: bool
+    :param collection_prefix: Prefix added to the collection names used by
+    the extension helpers, e.g. to isolate tests.
+    :type collection_prefix: str
 
     Usage:
     ------
@@ -156,6 +247,18 @@ class FlaskWeaviate(object):
     - `WEAVIATE_ADDITIONAL_HEADERS`: Additional headers for Weaviate requests.
     - `WEAVIATE_ADDITIONAL_CONFIG`: Additional configuration for Weaviate.
     - `WEAVIATE_SKIP_INIT_CHECKS`: Skip Weaviate client initialization checks.
+    - `WEAVIATE_RETRY_POLICY`: Retry policy for idempotent operations.
+    - `WEAVIATE_SERVER_TIMING`: Add a `Server-Timing` header (True/False).
+    - `WEAVIATE_SLOW_QUERY_THRESHOLD`: Slow query log threshold in seconds.
+    - `WEAVIATE_LOG_QUERY_VALUES`: Log slow call arguments unredacted (True/False).
+    - `WEAVIATE_MAX_WORKERS`: Size of the thread pool for concurrent queries.
+    - `WEAVIATE_MAX_CONCURRENT_CALLS`: Maximum number of Weaviate calls in flight.
+    - `WEAVIATE_MAX_QUEUE_WAIT`: Seconds to wait for a free call slot.
+    - `WEAVIATE_GREENLET_MODE`: Share clients between greenlets (True/False).
+    - `WEAVIATE_POOL_SIZE`: Number of clients shared in greenlet mode.
+    - `WEAVIATE_INIT_CHECKS_TTL`: Seconds the init checks are cached per server.
+    - `WEAVIATE_SHARE_TOKENS`: Share OIDC tokens between clients (True/False).
+    - `WEAVIATE_COLLECTION_PREFIX`: Prefix added to collection names.
 
     """
 
@@ -180,6 +283,18 @@ class FlaskWeaviate(object):
         additional_headers: Optional[Dict] = None,
         additional_config: Optional[AdditionalConfig] = None,
         skip_init_checks: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        server_timing: bool = True,
+        slow_query_threshold: Optional[float] = None,
+        log_query_values: bool = False,
+        max_workers: int = 8,
+        max_concurrent_calls: Optional[int] = None,
+        max_queue_wait: float = 1.0,
+        greenlet_mode: Optional[bool] = None,
+        pool_size: int = 4,
+        init_checks_ttl: float = 300,
+        share_tokens: bool = True,
+        collection_prefix: str = "",
     ):
         # Connection check. first check setup with params,
         # then connection params else embedded is set as standard
@@ -226,6 +341,22 @@ class FlaskWeaviate(object):
         self.additional_headers = additional_headers
         self.additional_config = additional_config
         self.skip_init_checks = skip_init_checks
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.server_timing = server_timing
+        self.slow_query_threshold = slow_query_threshold
+        self.log_query_values = log_query_values
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self.bulkhead = Bulkhead(max_concurrent_calls, max_queue_wait)
+        self.greenlet_mode = greenlet_mode
+        self.pool_size = pool_size
+        self._client_pool = None
+        self.init_checks_ttl = init_checks_ttl
+        self.share_tokens = share_tokens
+        self.collection_prefix = collection_prefix
+        # clients created without init checks because of a cached result
+        self._unchecked_clients = weakref.WeakKeyDictionary()
         if self.connection_params is None and self.embedded_options is None:
             raise ValueError(
                 "Both connection_params and embedded_options cannot be None."
@@ -287,6 +418,38 @@ class FlaskWeaviate(object):
             self.additional_config = app.config.get("WEAVIATE_ADDITIONAL_CONFIG")
         if app.config.get("WEAVIATE_SKIP_INIT_CHECKS") is not None:
             self.skip_init_checks = app.config.get("WEAVIATE_SKIP_INIT_CHECKS")
+        if app.config.get("WEAVIATE_RETRY_POLICY") is not None:
+            self.retry_policy = app.config.get("WEAVIATE_RETRY_POLICY")
+        if app.config.get("WEAVIATE_SERVER_TIMING") is not None:
+            self.server_timing = app.config.get("WEAVIATE_SERVER_TIMING")
+        if app.config.get("WEAVIATE_SLOW_QUERY_THRESHOLD") is not None:
+            self.slow_query_threshold = app.config.get(
+                "WEAVIATE_SLOW_QUERY_THRESHOLD"
+            )
+        if app.config.get("WEAVIATE_LOG_QUERY_VALUES") is not None:
+            self.log_query_values = app.config.get("WEAVIATE_LOG_QUERY_VALUES")
+        if app.config.get("WEAVIATE_MAX_WORKERS") is not None:
+            self.max_workers = app.config.get("WEAVIATE_MAX_WORKERS")
+        if (
+            app.config.get("WEAVIATE_MAX_CONCURRENT_CALLS") is not None
+            or app.config.get("WEAVIATE_MAX_QUEUE_WAIT") is not None
+        ):
+            self.bulkhead = Bulkhead(
+                app.config.get(
+                    "WEAVIATE_MAX_CONCURRENT_CALLS", self.bulkhead.max_concurrent
+                ),
+                app.config.get("WEAVIATE_MAX_QUEUE_WAIT", self.bulkhead.max_wait),
+            )
+        if app.config.get("WEAVIATE_GREENLET_MODE") is not None:
+            self.greenlet_mode = app.config.get("WEAVIATE_GREENLET_MODE")
+        if app.config.get("WEAVIATE_POOL_SIZE") is not None:
+            self.pool_size = app.config.get("WEAVIATE_POOL_SIZE")
+        if app.config.get("WEAVIATE_INIT_CHECKS_TTL") is not None:
+            self.init_checks_ttl = app.config.get("WEAVIATE_INIT_CHECKS_TTL")
+        if app.config.get("WEAVIATE_SHARE_TOKENS") is not None:
+            self.share_tokens = app.config.get("WEAVIATE_SHARE_TOKENS")
+        if app.config.get("WEAVIATE_COLLECTION_PREFIX") is not None:
+            self.collection_prefix = app.config.get("WEAVIATE_COLLECTION_PREFIX")
 
         # Store the WeaviateClient instance in the app context
         if not hasattr(app, "extensions"):
@@ -301,10 +464,24 @@ class FlaskWeaviate(object):
             :param response_or_exception:
             """
             weaviate_client = g.pop('weaviate_client', None)
-            if weaviate_client is not None:
+            # clients of the shared pool outlive the app context
+            if weaviate_client is not None and not g.pop('weaviate_shared', False):
                 weaviate_client.close()
             return response_or_exception
 
+        @app.after_request
+        def add_server_timing(response):
+            """
+            Report the time spent in Weaviate in a `Server-Timing` header.
+
+            :param response:
+            """
+            if self.server_timing:
+                header = server_timing_header(get_timings())
+                if header is not None:
+                    response.headers.add("Server-Timing", header)
+            return response
+
         return app
 
     @property
@@ -319,15 +496,602 @@ class FlaskWeaviate(object):
         :return: The WeaviateClient instance.
         :rtype: WeaviateClient
         """
+        if g.get('weaviate_client', None) is None and self.cooperative:
+            g.weaviate_client = self.client_pool.get()
+            g.weaviate_shared = True
         if g.get('weaviate_client', None) is None:
-            g.weaviate_client = WeaviateClient(**self.weaviate_config)
+            g.weaviate_client = self._create_client()
         if g.weaviate_client.is_connected() is False:
-            try:
-                g.weaviate_client.connect()
-            except WeaviateStartUpError as e:
-                raise Exception("Failed to connect to Weaviate server") from e
+            g.weaviate_client = self._open(g.weaviate_client)
         return g.weaviate_client
 
+    def _create_client(self, config: Optional[Dict] = None) -> WeaviateClient:
+        config = dict(config or self.weaviate_config)
+        # clients shared in greenlet mode live long and refresh their own token
+        if self.share_tokens and not self.cooperative:
+            self._use_shared_token(config)
+        if (
+            self.init_checks_ttl
+            and not config["skip_init_checks"]
+            and server_meta_cache.get(bind_key(config), self.init_checks_ttl)
+        ):
+            config["skip_init_checks"] = True
+            client = WeaviateClient(**config)
+            self._unchecked_clients[client] = bind_key(config)
+            return client
+        return WeaviateClient(**config)
+
+    def _use_shared_token(self, config: Dict) -> None:
+        credentials = config["auth_client_secret"]
+        params = config["connection_params"]
+        if params is None or not isinstance(
+            credentials, (_ClientPassword, _ClientCredentials)
+        ):
+            return
+        scheme = "https" if params.http.secure else "http"
+        url = f"{scheme}://{params.http.host}:{params.http.port}"
+        try:
+            token = token_cache.access_token(
+                credentials_key(url, credentials), OidcTokenSource(url, credentials)
+            )
+        except Exception:
+            # let the client authenticate itself and report the error; the
+            # cache backs off, so this does not fetch again every request
+            return
+        # with an authorization header the client skips the OIDC flow
+        config["auth_client_secret"] = None
+        config["additional_headers"] = {
+            **(config["additional_headers"] or {}),
+            "authorization": f"Bearer {token}",
+        }
+
+    def _open(self, client: WeaviateClient) -> WeaviateClient:
+        key = self._unchecked_clients.pop(client, None)
+        try:
+            self._connect(client)
+        except Exception:
+            if key is None:
+                raise
+            # The cached checks are stale, e.g. the server was replaced.
+            # Connect again with a client that runs the checks.
+            server_meta_cache.invalidate(key)
+            client.close()
+            replacement = self._create_client()
+            try:
+                return self._open(replacement)
+            except Exception:
+                # it is not stored on g, so teardown would not close it
+                replacement.close()
+                raise
+        if key is None and self.init_checks_ttl and not self.skip_init_checks:
+            server_meta_cache.set(bind_key(self.weaviate_config), client.get_meta())
+        return client
+
+    def _connect(self, client: WeaviateClient) -> WeaviateClient:
+        try:
+            with self.timed("connect"):
+                client.connect()
+        except WeaviateStartUpError as e:
+            # a client that failed half-way reports itself as connected;
+            # closing it lets the next access or retry connect again
+            client.close()
+            raise WeaviateConnectError("Failed to connect to Weaviate server") from e
+        instrument_client(client, self._transport_call)
+        return client
+
+    @contextmanager
+    def _transport_call(self, kind: str, operation: str, collection: Optional[str]):
+        # The helpers already hold a slot, which the bulkhead lets them
+        # reuse. Calls from the client's own threads, such as the dynamic
+        # batch scheduler or the token refresh, are not limited: they would
+        # compete with the request they serve, and a rejection would end
+        # the token refresh thread.
+        if has_app_context() or self.bulkhead.held:
+            limit = self.bulkhead.limit()
+        else:
+            limit = nullcontext()
+        with limit:
+            # calls made by the helpers are already timed with their arguments
+            if is_measuring():
+                yield
+            else:
+                with self.timed(kind, collection, operation):
+                    yield
+
+    @property
+    def server_meta(self) -> Dict:
+        """
+        The metadata of the Weaviate server, such as its version and modules.
+
+        Cached process-wide for `init_checks_ttl` seconds.
+
+        :return: The response of the meta endpoint.
+        :rtype: Dict
+        """
+        key = bind_key(self.weaviate_config)
+        meta = server_meta_cache.get(key, self.init_checks_ttl)
+        if meta is None or not self.init_checks_ttl:
+            meta = self.client.get_meta()
+            if self.init_checks_ttl:
+                server_meta_cache.set(key, meta)
+        return meta
+
+    @property
+    def cooperative(self) -> bool:
+        """
+        Whether clients are shared between greenlets.
+
+        :return: `greenlet_mode`, or whether gevent or eventlet
+        monkey-patched the process when it is not set.
+        :rtype: bool
+        """
+        if self.greenlet_mode is None:
+            return detect_monkey_patching() is not None
+        return bool(self.greenlet_mode)
+
+    @property
+    def client_pool(self) -> SharedClientPool:
+        """
+        The clients shared by all greenlets in greenlet mode.
+
+        Under gevent, gRPC is switched to cooperative I/O first, so
+        greenlets waiting on Weaviate yield to the hub.
+
+        :return: The SharedClientPool instance.
+        :rtype: SharedClientPool
+        """
+        if self._client_pool is None:
+            with self._lock:
+                if self._client_pool is None:
+                    if detect_monkey_patching() == "gevent":
+                        init_grpc_gevent()
+                    config = self.weaviate_config
+                    self._client_pool = SharedClientPool(
+                        lambda: self._open(self._create_client(config)),
+                        self.pool_size,
+                    )
+        return self._client_pool
+
+    @contextmanager
+    def timed(
+        self,
+        kind: str,
+        collection: Optional[str] = None,
+        operation: Optional[str] = None,
+        args: tuple = (),
+        kwargs: Optional[Dict] = None,
+    ):
+        """
+        Measure a Weaviate call for the `Server-Timing` header and slow query log.
+
+        ```python
+        with weaviate.timed("query", "Article", "aggregate"):
+            articles.aggregate.over_all(total_count=True)
+        ```
+
+        :param kind: The kind of call: `connect`, `query` or `batch`.
+        :type kind: str
+        :param collection: The collection the call is made on.
+        :type collection: str | None
+        :param operation: The name of the operation.
+        :type operation: str | None
+        :param args: Positional arguments of the call, logged redacted.
+        :type args: tuple
+        :param kwargs: Keyword arguments of the call, logged redacted.
+        :type kwargs: Dict | None
+        """
+        start = time.perf_counter()
+        try:
+            with measuring():
+                yield
+        finally:
+            duration = time.perf_counter() - start
+            record_timing(kind, duration)
+            if (
+                self.slow_query_threshold is not None
+                and duration >= self.slow_query_threshold
+            ):
+                log_slow_query(
+                    kind,
+                    collection,
+                    operation,
+                    args,
+                    kwargs or {},
+                    duration,
+                    redact=not self.log_query_values,
+                )
+
+    def collection(self, name: str, client: Optional[WeaviateClient] = None):
+        """
+        Get a collection by name, with `collection_prefix` applied.
+
+        :param name: The name of the collection without prefix.
+        :type name: str
+        :param client: The client to use, defaults to :attr:`client`.
+        :type client: WeaviateClient | None
+        :return: The collection.
+        """
+        client = client if client is not None else self.client
+        return client.collections.get(self.collection_prefix + name)
+
+    @contextmanager
+    def batch(self, collection: str, mode: str = "dynamic", **kwargs):
+        """
+        Open a batch on a collection, timed as `batch`.
+
+        ```python
+        with weaviate.batch("Article") as batch:
+            batch.add_object({"title": "Flask"})
+        ```
+
+        :param collection: The name of the collection.
+        :type collection: str
+        :param mode: The batching mode: `dynamic`, `fixed_size` or `rate_limit`.
+        :type mode: str
+        """
+        batch = self.collection(collection).batch
+        with self.bulkhead.limit():
+            with self.timed("batch", collection, mode, kwargs=kwargs):
+                with getattr(batch, mode)(**kwargs) as b:
+                    yield b
+
+    def retry(self, func):
+        """
+        Decorate an idempotent function to retry it on transient errors.
+
+        Only use this for reads; writes may be applied twice.
+
+        ```python
+        @weaviate.retry
+        def count_articles():
+            return weaviate.client.collections.get("Article").aggregate.over_all()
+        ```
+
+        :param func: The function to decorate.
+        :type func: Callable
+        """
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.retry_policy.call(func, *args, **kwargs)
+
+        return wrapper
+
+    def query(self, collection: str, operation: str, *args, **kwargs):
+        """
+        Run a query on a collection, retrying on transient errors.
+
+        ```python
+        weaviate.query("Article", "near_text", query="flask", limit=10)
+        ```
+
+        :param collection: The name of the collection.
+        :type collection: str
+        :param operation: The query method, e.g. `bm25` or `fetch_object_by_id`.
+        :type operation: str
+        :return: The query result.
+        """
+        return self.retry_policy.call(
+            self._run_query, collection, operation, *args, **kwargs
+        )
+
+    def _run_query(self, collection: str, operation: str, *args, **kwargs):
+        return self._query_client(self.client, collection, operation, args, kwargs)
+
+    def _query_client(
+        self,
+        client: WeaviateClient,
+        collection: str,
+        operation: str,
+        args: tuple,
+        kwargs: Dict,
+    ):
+        query = self.collection(collection, client).query
+        with self.bulkhead.limit():
+            with self.timed("query", collection, operation, args, kwargs):
+                return getattr(query, operation)(*args, **kwargs)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        The thread pool shared by the concurrent query helpers.
+
+        :return: The ThreadPoolExecutor instance.
+        :rtype: ThreadPoolExecutor
+        """
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="flask-weaviate",
+                    )
+        return self._executor
+
+    def fan_out(
+        self,
+        collections: Union[Sequence[str], Dict[str, Dict]],
+        operation: str = "hybrid",
+        fusion: str = "rrf",
+        limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> FanOutResult:
+        """
+        Query several collections concurrently and fuse the results.
+
+        The queries share the client of the current app context, which is
+        safe to use from several threads, and run on :attr:`executor`.
+        Each query is retried like :meth:`query`. Collections that fail or
+        do not answer within `timeout` are left out of the fused result
+        and listed in `errors` and `timed_out` instead. The timeout is
+        also the deadline of the queries themselves, so timed out queries
+        fail soon after and free their worker; their client is closed
+        once they have, instead of at app context teardown.
+
+        ```python
+        result = weaviate.fan_out(
+            ["Article", "Page", "Product"], "hybrid", query="flask", limit=10,
+            timeout=0.5,
+        )
+        for fused in result.objects:
+            print(fused.collection, fused.object.properties, fused.score)
+        ```
+
+        :param collections: The collection names, or a mapping of collection
+        names to keyword arguments that override `kwargs` for that collection.
+        :type collections: Sequence[str] | Dict[str, Dict]
+        :param operation: The query method run on every collection.
+        :type operation: str
+        :param fusion: How to merge the results: `rrf` (reciprocal rank
+        fusion) or `score` (min-max normalized scores).
+        :type fusion: str
+        :param limit: The number of fused objects to return; also passed
+        to every query.
+        :type limit: int | None
+        :param timeout: Seconds to wait for the collections to answer.
+        :type timeout: float | None
+        :return: The fused objects with the raw results and failures.
+        :rtype: FanOutResult
+        """
+        if fusion not in FUSION_METHODS:
+            raise ValueError(
+                f"Unknown fusion method {fusion!r}, "
+                f"use one of {', '.join(FUSION_METHODS)}."
+            )
+        if not isinstance(collections, dict):
+            collections = {name: {} for name in collections}
+        if limit is not None:
+            kwargs["limit"] = limit
+
+        client = self.client
+        result = FanOutResult()
+        at = time.monotonic() + timeout if timeout is not None else None
+        with self.timed("query", None, "fan_out"):
+            futures = {
+                self.executor.submit(
+                    run_until,
+                    at,
+                    self.retry_policy.call,
+                    self._query_client,
+                    client,
+                    name,
+                    operation,
+                    (),
+                    {**kwargs, **overrides},
+                ): name
+                for name, overrides in collections.items()
+            }
+            not_done = wait(futures, timeout=timeout).not_done
+        running = [future for future in not_done if not future.cancel()]
+        if running:
+            self._close_after(client, running)
+
+        for future, name in futures.items():
+            if future in not_done:
+                result.timed_out.append(name)
+                continue
+            try:
+                result.results[name] = future.result()
+            except Exception as e:
+                result.errors[name] = e
+
+        result.objects = FUSION_METHODS[fusion](result.results)[:limit]
+        return result
+
+    def _close_after(self, client: WeaviateClient, futures: List) -> None:
+        """
+        Hand the client of the app context over to still running futures.
+
+        The client is closed when the last of them is done, instead of at
+        teardown while they still use it. The next access to :attr:`client`
+        in the app context opens a new client.
+        """
+        if g.get("weaviate_shared", False) or g.get("weaviate_client") is not client:
+            return
+        g.pop("weaviate_client")
+        pending = [len(futures)]
+        lock = threading.Lock()
+
+        def done(future):
+            with lock:
+                pending[0] -= 1
+                last = pending[0] == 0
+            if last:
+                client.close()
+
+        for future in futures:
+            future.add_done_callback(done)
+
+    def multi_query(
+        self,
+        specs: Sequence[Union[QuerySpec, Dict]],
+        concurrency: Optional[int] = None,
+    ) -> List[QueryOutcome]:
+        """
+        Run many queries concurrently over the client of the current app context.
+
+        All queries share one client, so they are multiplexed over its
+        gRPC channel instead of opening a connection each. At most
+        `concurrency` queries are in flight at once. A failing query does
+        not fail the others; its exception is returned in its outcome, and
+        so is the ValueError of an invalid spec.
+
+        ```python
+        outcomes = weaviate.multi_query([
+            {"collection": "Article", "operation": "near_vector",
+             "args": [vector], "kwargs": {"limit": 1}}
+            for vector in request.json["vectors"]
+        ])
+        duplicates = [o.result.objects for o in outcomes if o.ok]
+        ```
+
+        :param specs: The queries, as QuerySpec instances or dicts.
+        :type specs: Sequence[QuerySpec | Dict]
+        :param concurrency: The maximum number of queries in flight,
+        defaults to `max_workers`.
+        :type concurrency: int | None
+        :return: One outcome per spec, in input order.
+        :rtype: List[QueryOutcome]
+        """
+        if not specs:
+            return []
+        slots = threading.BoundedSemaphore(concurrency or self.max_workers)
+        client = self.client
+        outcomes = []
+        futures = []
+        with self.timed("query", None, "multi_query"):
+            for spec in specs:
+                try:
+                    spec = QuerySpec.create(spec)
+                except ValueError as e:
+                    outcomes.append(QueryOutcome(spec, error=e))
+                    continue
+                slots.acquire()
+                future = self.executor.submit(
+                    self.retry_policy.call,
+                    self._query_client,
+                    client,
+                    spec.collection,
+                    spec.operation,
+                    spec.args,
+                    spec.kwargs,
+                )
+                future.add_done_callback(lambda f: slots.release())
+                outcomes.append(QueryOutcome(spec))
+                futures.append((outcomes[-1], future))
+            wait([future for _, future in futures])
+
+        for outcome, future in futures:
+            try:
+                outcome.result = future.result()
+            except Exception as e:
+                outcome.error = e
+        return outcomes
+
+    def paginate(
+        self,
+        collection: str,
+        limit: int = 25,
+        cursor_arg: str = "cursor",
+        **kwargs,
+    ) -> Page:
+        """
+        Fetch a page of a collection using the UUID cursor.
+
+        Pages are fetched with `after` instead of `offset`, so every page
+        costs the same as the first and there is no maximum depth. The
+        cursor is read from the `cursor_arg` request argument and handed
+        out as an opaque token signed with the app `SECRET_KEY`, which is
+        only valid for the same collection. Weaviate does not combine the
+        cursor with filters or sorting, so these are rejected.
+
+        ```python
+        @app.route('/articles')
+        def articles():
+            page = weaviate.paginate("Article", limit=50)
+            return weaviate.to_response(page)  # includes the "next" link
+        ```
+
+        :param collection: The name of the collection.
+        :type collection: str
+        :param limit: The number of objects per page.
+        :type limit: int
+        :param cursor_arg: The request argument holding the token.
+        :type cursor_arg: str
+        :return: The page with the token and URL of the next page.
+        :rtype: Page
+        :raises InvalidCursorError: When the token is invalid (400).
+        :raises ValueError: When `filters` or `sort` are given.
+        """
+        for unsupported in ("filters", "sort"):
+            if kwargs.get(unsupported) is not None:
+                raise ValueError(
+                    f"Weaviate cannot combine the cursor with {unsupported}, "
+                    f"use offset based paging with {unsupported}."
+                )
+        token = request.args.get(cursor_arg)
+        after = load_cursor(token, collection) if token else None
+        result = self.query(
+            collection, "fetch_objects", limit=limit, after=after, **kwargs
+        )
+        page = Page(objects=result.objects, result=result)
+        if len(result.objects) == limit and limit > 0:
+            page.next_cursor = dump_cursor(collection, result.objects[-1].uuid)
+            if request.endpoint is not None:
+                page.next_url = next_url(cursor_arg, page.next_cursor)
+        return page
+
+    def to_response(
+        self,
+        result,
+        properties: Optional[Sequence[str]] = None,
+        vector: str = "omit",
+        metadata: bool = True,
+        status: int = 200,
+    ) -> Response:
+        """
+        Serialize a query or fetch result into a JSON response.
+
+        Builds the JSON directly from the result objects instead of going
+        through `jsonify`, using orjson when it is installed.
+
+        ```python
+        @app.route('/search')
+        def search():
+            result = weaviate.query("Article", "bm25", query=request.args["q"])
+            return weaviate.to_response(result, properties=["title"])
+        ```
+
+        :param result: The result of a query or fetch.
+        :param properties: Only include these properties, None for all.
+        :type properties: Sequence[str] | None
+        :param vector: Leave vectors out (`omit`), write them as a list
+        (`list`) or as base64 encoded float32 (`base64`).
+        :type vector: str
+        :param metadata: Include the metadata fields that are set.
+        :type metadata: bool
+        :param status: The status code of the response.
+        :type status: int
+        :return: The JSON response.
+        :rtype: Response
+        """
+        return to_response(result, properties, vector, metadata, status)
+
+    @property
+    def bulkhead_stats(self) -> Dict[str, float]:
+        """
+        Queue wait and rejection metrics, see :attr:`Bulkhead.stats`.
+        """
+        return self.bulkhead.stats
+
+    @property
+    def retry_stats(self) -> Dict[str, int]:
+        """
+        How often the retry policy fired, see :attr:`RetryPolicy.stats`.
+        """
+        return self.retry_policy.stats
+
     @property
     def weaviate_config(self):
         # Define weaviate_config as a property
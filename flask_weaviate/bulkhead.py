@@ -0,0 +1,125 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from werkzeug.exceptions import ServiceUnavailable
+
+
+class BulkheadFullError(ServiceUnavailable):
+    """
+    Raised when no Weaviate call slot frees up within the maximum queue wait.
+
+    It is a 503 Service Unavailable HTTP exception, so Flask answers
+    with a 503 unless the application handles it.
+    """
+
+    description = "Too many concurrent Weaviate calls, try again later."
+
+
+class Bulkhead(object):
+    """
+    Limit the number of concurrent Weaviate calls.
+
+    When Weaviate slows down, calls beyond `max_concurrent` wait for at
+    most `max_wait` seconds for a slot and then fail fast with a
+    :class:`BulkheadFullError`, so request threads are not all tied up
+    waiting on Weaviate. A thread holding a slot does not take a second
+    one for the calls it makes within the block.
+
+    :param max_concurrent: The maximum number of calls in flight,
+    None for no limit.
+    :type max_concurrent: int | None
+    :param max_wait: Seconds to wait for a slot before rejecting a call.
+    :type max_wait: float
+    """
+
+    def __init__(self, max_concurrent: Optional[int] = None, max_wait: float = 1.0):
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1.")
+        self.max_concurrent = max_concurrent
+        self.max_wait = max_wait
+        self._slots = (
+            threading.BoundedSemaphore(max_concurrent)
+            if max_concurrent is not None
+            else None
+        )
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {
+            "in_flight": 0,
+            "accepted": 0,
+            "rejected": 0,
+            "queue_wait_total": 0.0,
+            "queue_wait_max": 0.0,
+        }
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Counters of the bulkhead.
+
+        - `in_flight`: calls currently running.
+        - `accepted`: calls that got a slot.
+        - `rejected`: calls rejected with a :class:`BulkheadFullError`.
+        - `queue_wait_total`: seconds accepted calls waited for a slot.
+        - `queue_wait_max`: the longest wait for a slot in seconds.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _acquire(self) -> None:
+        if self._slots is None:
+            return
+        start = time.perf_counter()
+        if self.max_wait > 0:
+            acquired = self._slots.acquire(timeout=self.max_wait)
+        else:
+            acquired = self._slots.acquire(blocking=False)
+        waited = time.perf_counter() - start
+        with self._lock:
+            if not acquired:
+                self._stats["rejected"] += 1
+            else:
+                self._stats["queue_wait_total"] += waited
+                self._stats["queue_wait_max"] = max(
+                    self._stats["queue_wait_max"], waited
+                )
+        if not acquired:
+            raise BulkheadFullError()
+
+    @property
+    def held(self) -> bool:
+        """
+        Whether the current thread holds a slot.
+        """
+        return getattr(self._local, "depth", 0) > 0
+
+    @contextmanager
+    def limit(self):
+        """
+        Hold a call slot for the duration of the block.
+
+        :raises BulkheadFullError: When no slot frees up in time.
+        """
+        depth = getattr(self._local, "depth", 0)
+        if depth:
+            self._local.depth = depth + 1
+            try:
+                yield
+            finally:
+                self._local.depth -= 1
+            return
+        self._acquire()
+        with self._lock:
+            self._stats["accepted"] += 1
+            self._stats["in_flight"] += 1
+        self._local.depth = 1
+        try:
+            yield
+        finally:
+            self._local.depth = 0
+            with self._lock:
+                self._stats["in_flight"] -= 1
+            if self._slots is not None:
+                self._slots.release()
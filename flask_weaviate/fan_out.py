@@ -0,0 +1,120 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+#: The rank constant of reciprocal rank fusion, as proposed by Cormack et al.
+RRF_K = 60
+
+
+@dataclass
+class FusedObject:
+    """
+    An object returned by a fan-out search with its fused score.
+
+    :param collection: The collection the object was found in.
+    :param object: The Weaviate object as returned by the query.
+    :param score: The fused score, higher is better.
+    """
+
+    collection: str
+    object: Any
+    score: float
+
+
+@dataclass
+class FanOutResult:
+    """
+    The merged result of a search over several collections.
+
+    :param objects: The fused objects, best first.
+    :param results: The raw query result per collection.
+    :param errors: The exception per collection that failed.
+    :param timed_out: The collections that did not answer in time.
+    """
+
+    objects: List[FusedObject] = field(default_factory=list)
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+    timed_out: List[str] = field(default_factory=list)
+
+    @property
+    def partial(self) -> bool:
+        """True when not every collection contributed to the result."""
+        return bool(self.errors or self.timed_out)
+
+
+def _object_key(collection: str, obj: Any):
+    return collection, getattr(obj, "uuid", id(obj))
+
+
+def _raw_score(obj: Any) -> Optional[float]:
+    metadata = getattr(obj, "metadata", None)
+    if metadata is None:
+        return None
+    if getattr(metadata, "score", None) is not None:
+        return metadata.score
+    if getattr(metadata, "distance", None) is not None:
+        return -metadata.distance
+    if getattr(metadata, "certainty", None) is not None:
+        return metadata.certainty
+    return None
+
+
+def reciprocal_rank_fusion(
+    results: Dict[str, Any], k: int = RRF_K
+) -> List[FusedObject]:
+    """
+    Merge ranked results with reciprocal rank fusion.
+
+    Every object scores ``1 / (k + rank)`` per list it appears in. Only
+    ranks are used, so scores of different query types or collections do
+    not need to be comparable.
+
+    :param results: The query result per collection.
+    :type results: Dict[str, Any]
+    :param k: The rank constant.
+    :type k: int
+    :return: The fused objects, best first.
+    :rtype: List[FusedObject]
+    """
+    fused: Dict[Any, FusedObject] = {}
+    for collection, result in results.items():
+        for rank, obj in enumerate(result.objects, start=1):
+            key = _object_key(collection, obj)
+            if key not in fused:
+                fused[key] = FusedObject(collection, obj, 0.0)
+            fused[key].score += 1.0 / (k + rank)
+    return sorted(fused.values(), key=lambda o: o.score, reverse=True)
+
+
+def score_fusion(results: Dict[str, Any]) -> List[FusedObject]:
+    """
+    Merge results by min-max normalizing their scores per collection.
+
+    Uses the `score`, `distance` or `certainty` metadata of the objects,
+    so request it with `return_metadata`. Results without any of these
+    are scored by rank instead.
+
+    :param results: The query result per collection.
+    :type results: Dict[str, Any]
+    :return: The fused objects, best first.
+    :rtype: List[FusedObject]
+    """
+    fused: Dict[Any, FusedObject] = {}
+    for collection, result in results.items():
+        objects = result.objects
+        scores = [_raw_score(obj) for obj in objects]
+        if any(score is None for score in scores):
+            scores = [float(-rank) for rank in range(len(objects))]
+        low, high = min(scores, default=0.0), max(scores, default=0.0)
+        for obj, score in zip(objects, scores):
+            normalized = (score - low) / (high - low) if high > low else 1.0
+            key = _object_key(collection, obj)
+            if key not in fused or fused[key].score < normalized:
+                fused[key] = FusedObject(collection, obj, normalized)
+    return sorted(fused.values(), key=lambda o: o.score, reverse=True)
+
+
+FUSION_METHODS = {
+    "rrf": reciprocal_rank_fusion,
+    "score": score_fusion,
+}
@@ -0,0 +1,97 @@
+import itertools
+import sys
+import threading
+from typing import Callable, List, Optional
+
+from weaviate import WeaviateClient
+
+_grpc_gevent_initialized = False
+
+
+def detect_monkey_patching() -> Optional[str]:
+    """
+    Detect whether gevent or eventlet monkey-patched the socket module.
+
+    Only looks at libraries that are already imported, so neither is
+    imported as a side effect.
+
+    :return: `gevent`, `eventlet` or None.
+    :rtype: str | None
+    """
+    if "gevent.monkey" in sys.modules:
+        if sys.modules["gevent.monkey"].is_module_patched("socket"):
+            return "gevent"
+    if "eventlet.patcher" in sys.modules:
+        if sys.modules["eventlet.patcher"].is_monkey_patched("socket"):
+            return "eventlet"
+    return None
+
+
+def init_grpc_gevent() -> None:
+    """
+    Make gRPC cooperate with the gevent hub.
+
+    Without this, gRPC calls block the hub, and with it every greenlet,
+    until the call completes. Must run before the first channel is created.
+    """
+    global _grpc_gevent_initialized
+    if not _grpc_gevent_initialized:
+        from grpc.experimental import gevent as grpc_gevent
+
+        grpc_gevent.init_gevent()
+        _grpc_gevent_initialized = True
+
+
+class SharedClientPool(object):
+    """
+    A small set of connected clients shared by all greenlets.
+
+    A WeaviateClient can serve many concurrent calls: HTTP requests
+    go through a connection pool and gRPC calls are multiplexed over
+    one channel. Instead of a client per app context, greenlets are
+    handed the clients of this pool round-robin, which keeps the number
+    of connections fixed however many greenlets there are. The clients
+    are created on first use and replaced when they disconnect.
+
+    :param factory: Creates a new connected client.
+    :type factory: Callable[[], WeaviateClient]
+    :param size: The number of clients to share.
+    :type size: int
+    """
+
+    def __init__(self, factory: Callable[[], WeaviateClient], size: int = 4):
+        if size < 1:
+            raise ValueError("size must be at least 1.")
+        self.factory = factory
+        self.size = size
+        self._clients: List[Optional[WeaviateClient]] = [None] * size
+        self._locks = [threading.Lock() for _ in range(size)]
+        self._next = itertools.count()
+
+    def get(self) -> WeaviateClient:
+        """
+        Hand out the next client, connecting it if needed.
+
+        :return: A connected, shared WeaviateClient.
+        :rtype: WeaviateClient
+        """
+        index = next(self._next) % self.size
+        client = self._clients[index]
+        if client is not None and client.is_connected():
+            return client
+        with self._locks[index]:
+            client = self._clients[index]
+            if client is None or not client.is_connected():
+                if client is not None:
+                    client.close()
+                client = self._clients[index] = self.factory()
+        return client
+
+    def close(self) -> None:
+        """
+        Close all clients of the pool.
+        """
+        for index, client in enumerate(self._clients):
+            if client is not None:
+                client.close()
+                self._clients[index] = None
@@ -0,0 +1,77 @@
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+def bind_key(config: Dict[str, Any]) -> Tuple:
+    """
+    Identify the Weaviate server a client configuration connects to.
+
+    :param config: The keyword arguments of a WeaviateClient, as returned
+    by :attr:`FlaskWeaviate.weaviate_config`.
+    :type config: Dict
+    :rtype: Tuple
+    """
+    params = config.get("connection_params")
+    if params is not None:
+        return (
+            "http",
+            params.http.host,
+            params.http.port,
+            params.http.secure,
+            params.grpc.host,
+            params.grpc.port,
+        )
+    options = config.get("embedded_options")
+    return ("embedded", options.hostname, options.port, options.grpc_port)
+
+
+class ServerMetaCache(object):
+    """
+    Remember per server that the init checks passed, with its metadata.
+
+    The startup checks of a WeaviateClient (readiness, gRPC health and
+    version checks) only need to pass once per server. While an entry is
+    fresh, new clients for that server can skip them. The maximum age of
+    an entry is given to :meth:`get`.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple, Tuple[float, Dict]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple, ttl: Optional[float]) -> Optional[Dict]:
+        """
+        The metadata of a server that passed the init checks within `ttl` seconds.
+
+        :param key: The server, see :func:`bind_key`.
+        :type key: Tuple
+        :param ttl: The maximum age of the entry in seconds, None never expires.
+        :type ttl: float | None
+        :return: The server metadata, or None when there is no fresh entry.
+        :rtype: Dict | None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        checked_at, meta = entry
+        if ttl is not None and time.monotonic() - checked_at > ttl:
+            return None
+        return meta
+
+    def set(self, key: Tuple, meta: Dict) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), meta)
+
+    def invalidate(self, key: Tuple) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+#: The cache shared by every extension in the process.
+server_meta_cache = ServerMetaCache()
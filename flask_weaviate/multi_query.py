@@ -0,0 +1,70 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence, Union
+
+
+@dataclass
+class QuerySpec:
+    """
+    A single query of a :meth:`FlaskWeaviate.multi_query` call.
+
+    :param collection: The name of the collection.
+    :param operation: The query method, e.g. `near_vector` or `bm25`.
+    :param args: Positional arguments of the query method.
+    :param kwargs: Keyword arguments of the query method.
+    """
+
+    collection: str
+    operation: str
+    args: Sequence[Any] = field(default_factory=tuple)
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def create(cls, spec: Union["QuerySpec", Dict[str, Any]]) -> "QuerySpec":
+        """
+        Build a spec from a dict with the same keys, e.g. a JSON payload.
+
+        The operation must be a public method of the query object, so a
+        payload cannot reach its private attributes.
+
+        :param spec: A QuerySpec or a dict with `collection`, `operation`
+        and optionally `args` and `kwargs`.
+        :type spec: QuerySpec | Dict
+        :rtype: QuerySpec
+        :raises ValueError: When the spec is incomplete or the operation
+        is not a public name.
+        """
+        if not isinstance(spec, cls):
+            try:
+                spec = cls(
+                    collection=spec["collection"],
+                    operation=spec["operation"],
+                    args=tuple(spec.get("args", ())),
+                    kwargs=dict(spec.get("kwargs", {})),
+                )
+            except (KeyError, TypeError, AttributeError, ValueError) as e:
+                raise ValueError(f"Invalid query spec: {spec!r}") from e
+        if not isinstance(spec.collection, str) or not isinstance(spec.operation, str):
+            raise ValueError(f"Invalid query spec: {spec!r}")
+        if not spec.operation.isidentifier() or spec.operation.startswith("_"):
+            raise ValueError(f"Invalid query operation: {spec.operation!r}")
+        return spec
+
+
+@dataclass
+class QueryOutcome:
+    """
+    The outcome of a single query of a :meth:`FlaskWeaviate.multi_query` call.
+
+    :param spec: The query that was run, or the spec as given when it is
+    invalid.
+    :param result: The query result, None when the query failed.
+    :param error: The exception raised by the query, if any.
+    """
+
+    spec: Union[QuerySpec, Dict[str, Any]]
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -0,0 +1,105 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Any, List, Optional
+from urllib.parse import urlencode
+from uuid import UUID
+
+from flask import current_app, request, url_for
+from itsdangerous import BadSignature, URLSafeSerializer
+from werkzeug.exceptions import BadRequest
+
+CURSOR_SALT = "flask-weaviate-cursor"
+
+
+class InvalidCursorError(BadRequest):
+    """
+    Raised when a continuation token was tampered with or belongs to
+    another query. It is a 400 Bad Request HTTP exception.
+    """
+
+    description = "Invalid pagination cursor."
+
+
+@dataclass
+class Page:
+    """
+    A page of objects from :meth:`FlaskWeaviate.paginate`.
+
+    :param objects: The objects of this page.
+    :param result: The raw query result.
+    :param next_cursor: The token of the next page, None on the last page.
+    :param next_url: The URL of the next page, None on the last page.
+    """
+
+    objects: List[Any]
+    result: Any
+    next_cursor: Optional[str] = None
+    next_url: Optional[str] = None
+
+
+def _serializer() -> URLSafeSerializer:
+    if not current_app.secret_key:
+        raise RuntimeError(
+            "Pagination cursors are signed with the app SECRET_KEY, which is not set."
+        )
+    return URLSafeSerializer(current_app.secret_key, salt=CURSOR_SALT)
+
+
+def next_url(cursor_arg: str, cursor: str) -> str:
+    """
+    The URL of the current request with the cursor argument replaced.
+
+    The query string is encoded here instead of passing the request
+    arguments to `url_for`, which treats names such as `_external` or
+    `_method` as its own options.
+
+    :param cursor_arg: The request argument holding the token.
+    :type cursor_arg: str
+    :param cursor: The token of the next page.
+    :type cursor: str
+    :rtype: str
+    """
+    args = request.args.copy()
+    args[cursor_arg] = cursor
+    url = url_for(request.endpoint, **(request.view_args or {}))
+    return f"{url}?{urlencode(list(args.items(multi=True)))}"
+
+
+def _fingerprint(collection: str) -> str:
+    # binds a cursor to the collection it was issued for
+    return hashlib.sha256(collection.encode()).hexdigest()[:16]
+
+
+def dump_cursor(collection: str, after: UUID) -> str:
+    """
+    Create a signed continuation token for the objects after `after`.
+
+    :param collection: The name of the collection.
+    :type collection: str
+    :param after: The UUID of the last object of the current page.
+    :type after: UUID
+    :rtype: str
+    """
+    return _serializer().dumps([_fingerprint(collection), str(after)])
+
+
+def load_cursor(token: str, collection: str) -> UUID:
+    """
+    Read the UUID cursor from a continuation token.
+
+    :param token: The continuation token.
+    :type token: str
+    :param collection: The name of the collection.
+    :type collection: str
+    :return: The UUID to continue after.
+    :rtype: UUID
+    :raises InvalidCursorError: When the token is invalid or was issued
+    for another collection.
+    """
+    try:
+        fingerprint, after = _serializer().loads(token)
+        if fingerprint != _fingerprint(collection):
+            raise InvalidCursorError()
+        return UUID(after)
+    except (BadSignature, ValueError, TypeError) as e:
+        raise InvalidCursorError() from e
@@ -0,0 +1,114 @@
+"""
+pytest fixtures for applications using Flask-Weaviate.
+
+Enable the plugin in the `conftest.py` of the application::
+
+    pytest_plugins = ["flask_weaviate.pytest_plugin"]
+"""
+import pytest
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("flask-weaviate")
+    group.addoption(
+        "--weaviate-refresh-snapshots",
+        action="store_true",
+        default=False,
+        help="Load Weaviate datasets again instead of restoring their snapshots.",
+    )
+    parser.addini(
+        "weaviate_version",
+        "Version of the embedded Weaviate instance used by the tests.",
+        default=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def weaviate_embedded(request, tmp_path_factory):
+    """
+    An embedded Weaviate instance shared by the whole test session.
+
+    Snapshots are kept in the pytest cache, so they survive between runs.
+    """
+    from flask_weaviate.testing import EmbeddedWeaviate
+
+    instance = EmbeddedWeaviate(
+        data_path=tmp_path_factory.mktemp("weaviate-data"),
+        snapshot_path=request.config.cache.mkdir("flask-weaviate-snapshots"),
+        version=request.config.getini("weaviate_version") or None,
+    )
+    instance.start()
+    yield instance
+    instance.stop()
+
+
+@pytest.fixture(scope="session")
+def weaviate_dataset(request, weaviate_embedded):
+    """
+    Load a dataset once, restoring it from a snapshot when there is one.
+
+    Datasets keep their collection names and are shared by all tests.
+
+    ```python
+    @pytest.fixture(scope="session")
+    def articles(weaviate_dataset):
+        weaviate_dataset("articles-v1", load_articles)
+    ```
+    """
+
+    refresh = request.config.getoption("--weaviate-refresh-snapshots")
+
+    def load(name, loader):
+        weaviate_embedded.load_dataset(name, loader, refresh=refresh)
+
+    return load
+
+
+@pytest.fixture
+def weaviate_namespace(weaviate_embedded):
+    """
+    A collection name prefix unique to the test; its collections are
+    deleted afterwards.
+    """
+    from flask_weaviate.testing import Namespace
+
+    namespace = Namespace()
+    yield namespace
+    client = weaviate_embedded.client()
+    try:
+        namespace.cleanup(client)
+    finally:
+        client.close()
+
+
+@pytest.fixture
+def weaviate_app_config(weaviate_embedded):
+    """
+    Flask config connecting the extension to the session instance.
+
+    ```python
+    @pytest.fixture
+    def app(weaviate_app_config):
+        return create_app(weaviate_app_config)
+    ```
+    """
+    return {
+        "WEAVIATE_CONNECTION_PARAMS": weaviate_embedded.connection_params,
+        "WEAVIATE_SKIP_INIT_CHECKS": True,
+    }
+
+
+@pytest.fixture
+def weaviate_namespaced_app_config(weaviate_app_config, weaviate_namespace):
+    """
+    Like `weaviate_app_config`, with the namespace of the test as the
+    collection prefix of the extension helpers.
+
+    Only `weaviate.collection(...)`, `query`, `batch` and the other
+    helpers apply the prefix; calls on `weaviate.client` directly are not
+    isolated. Datasets are not prefixed, so reach them on `weaviate.client`.
+    """
+    return {
+        **weaviate_app_config,
+        "WEAVIATE_COLLECTION_PREFIX": weaviate_namespace.prefix,
+    }
@@ -0,0 +1,230 @@
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import grpc
+import httpx
+from weaviate.exceptions import (
+    UnexpectedStatusCodeError,
+    WeaviateConnectionError,
+    WeaviateGRPCUnavailableError,
+    WeaviateQueryError,
+    WeaviateStartUpError,
+)
+
+from flask_weaviate.transport import remaining
+
+#: gRPC status codes that indicate the server could not be reached or is
+#: temporarily unable to serve, e.g. while a Weaviate node restarts.
+TRANSIENT_GRPC_CODES = (
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+)
+
+#: HTTP status codes returned by Weaviate or a proxy in front of it
+#: while a node is unavailable.
+TRANSIENT_STATUS_CODES = (429, 502, 503, 504)
+
+#: Fragments of gRPC error details that the weaviate client flattens into
+#: a :class:`WeaviateQueryError` message.
+TRANSIENT_MESSAGES = (
+    "unavailable",
+    "connection reset",
+    "socket closed",
+    "deadline exceeded",
+    "failed to connect",
+)
+
+
+class WeaviateConnectError(WeaviateStartUpError):
+    """
+    Connecting a client to the Weaviate server failed.
+
+    The error raised by the client is kept as the cause.
+    """
+
+
+def is_transient(exc: BaseException) -> bool:
+    """
+    Check whether an exception raised by the Weaviate client is worth retrying.
+
+    :param exc: The exception raised by the Weaviate client.
+    :type exc: BaseException
+    :return: True when the error is a transient network or availability error.
+    :rtype: bool
+    """
+    if isinstance(exc, grpc.RpcError) and hasattr(exc, "code"):
+        return exc.code() in TRANSIENT_GRPC_CODES
+    if isinstance(exc, (httpx.TransportError, WeaviateGRPCUnavailableError,
+                        WeaviateConnectionError)):
+        return True
+    if isinstance(exc, WeaviateConnectError):
+        # e.g. a node that restarts; a server that is too old stays too old
+        return "not supported" not in str(exc.__cause__)
+    if isinstance(exc, UnexpectedStatusCodeError):
+        return exc.status_code in TRANSIENT_STATUS_CODES
+    if isinstance(exc, WeaviateQueryError):
+        # The client re-raises gRPC errors inside the except block,
+        # so the original status is still reachable as the context.
+        if isinstance(exc.__context__, grpc.RpcError):
+            return is_transient(exc.__context__)
+        message = str(exc.message).lower()
+        return any(fragment in message for fragment in TRANSIENT_MESSAGES)
+    return False
+
+
+class RetryBudget(object):
+    """
+    A process-wide token bucket that limits how many retries may be made.
+
+    Modelled after gRPC retry throttling: every failed attempt takes one
+    token, every successful call gives back `token_ratio` tokens, and
+    retries are only allowed while more than half of `max_tokens` are
+    available. During an outage the bucket drains quickly, so retries
+    stop adding load to a cluster that is already struggling.
+
+    :param max_tokens: The size of the bucket.
+    :type max_tokens: float
+    :param token_ratio: Tokens returned to the bucket for every success.
+    :type token_ratio: float
+    """
+
+    def __init__(self, max_tokens: float = 10.0, token_ratio: float = 0.1):
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be greater than 0.")
+        self.max_tokens = float(max_tokens)
+        self.token_ratio = float(token_ratio)
+        self._tokens = self.max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+
+    def can_retry(self) -> bool:
+        return self._tokens > self.max_tokens / 2
+
+
+#: Budget shared by every :class:`RetryPolicy` that does not bring its own.
+default_retry_budget = RetryBudget()
+
+
+class RetryPolicy(object):
+    """
+    Retry idempotent Weaviate operations with exponential backoff and jitter.
+
+    The delay before retry `n` is drawn uniformly from
+    ``[0, min(max_backoff, initial_backoff * multiplier ** n)]``
+    ("full jitter"), so clients that failed together do not retry together.
+
+    :param max_attempts: Total number of attempts, including the first one.
+    :type max_attempts: int
+    :param initial_backoff: Upper bound of the first delay in seconds.
+    :type initial_backoff: float
+    :param max_backoff: Upper bound of any delay in seconds.
+    :type max_backoff: float
+    :param multiplier: Growth factor of the delay bound per attempt.
+    :type multiplier: float
+    :param budget: The retry budget to draw from, defaults to the
+    process-wide :data:`default_retry_budget`.
+    :type budget: RetryBudget | None
+    :param retry_on: Predicate deciding whether an exception is retried.
+    :type retry_on: Callable[[BaseException], bool]
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 2.0,
+        multiplier: float = 2.0,
+        budget: Optional[RetryBudget] = None,
+        retry_on: Callable[[BaseException], bool] = is_transient,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.budget = budget if budget is not None else default_retry_budget
+        self.retry_on = retry_on
+        self._stats = {"calls": 0, "retries": 0, "exhausted": 0, "throttled": 0}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters of how often the policy fired.
+
+        - `calls`: operations run through the policy.
+        - `retries`: attempts made after a transient failure.
+        - `exhausted`: operations that failed after `max_attempts`.
+        - `throttled`: retries refused because the budget was drained.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute the delay before the given retry attempt.
+
+        :param attempt: The zero-based number of the retry.
+        :type attempt: int
+        :return: The delay in seconds.
+        :rtype: float
+        """
+        bound = min(self.max_backoff, self.initial_backoff * self.multiplier ** attempt)
+        return random.uniform(0, bound)
+
+    def call(self, func: Callable, *args, **kwargs):
+        """
+        Run `func` and retry it on transient errors.
+
+        Only use this for idempotent operations such as queries and reads.
+
+        :param func: The operation to run.
+        :type func: Callable
+        :return: The return value of `func`.
+        """
+        self._count("calls")
+        attempt = 0
+        while True:
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not self.retry_on(e):
+                    raise
+                self.budget.record_failure()
+                attempt += 1
+                if attempt >= self.max_attempts:
+                    self._count("exhausted")
+                    raise
+                if not self.budget.can_retry():
+                    self._count("throttled")
+                    raise
+                delay = self.backoff(attempt - 1)
+                left = remaining()
+                if left is not None and delay >= left:
+                    # nobody waits for the result anymore
+                    self._count("exhausted")
+                    raise
+                self._count("retries")
+                time.sleep(delay)
+            else:
+                self.budget.record_success()
+                return result
@@ -0,0 +1,192 @@
+import array
+import base64
+import dataclasses
+import datetime
+import json
+import sys
+import uuid
+from typing import Any, Dict, Optional, Sequence
+
+from flask import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+#: How vectors are written: left out, as a list of floats, or as the
+#: base64 encoding of their little-endian float32 bytes.
+VECTOR_MODES = ("omit", "list", "base64")
+
+
+def encode_vector(vector: Sequence[float]) -> str:
+    """
+    Encode a vector compactly as base64 of little-endian float32 values.
+
+    Decode in JavaScript with
+    ``new Float32Array(Uint8Array.from(atob(s), c => c.charCodeAt(0)).buffer)``.
+
+    :param vector: The vector.
+    :type vector: Sequence[float]
+    :rtype: str
+    """
+    values = array.array("f", vector)
+    if sys.byteorder == "big":  # pragma: no cover - platform dependent
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _vector(vector: Any, mode: str) -> Any:
+    if isinstance(vector, dict):
+        return {name: _vector(v, mode) for name, v in vector.items()}
+    if mode == "base64" and vector is not None:
+        return encode_vector(vector)
+    return vector
+
+
+def object_to_dict(
+    obj: Any,
+    properties: Optional[Sequence[str]] = None,
+    vector: str = "omit",
+    metadata: bool = True,
+) -> Dict[str, Any]:
+    """
+    Turn a Weaviate object into a dict ready to be dumped as JSON.
+
+    Values such as UUIDs and datetimes are left as they are; the JSON
+    backend encodes them, which orjson does natively.
+
+    :param obj: An object of a query or fetch result.
+    :param properties: Only include these properties, None for all.
+    :type properties: Sequence[str] | None
+    :param vector: One of :data:`VECTOR_MODES`.
+    :type vector: str
+    :param metadata: Include the metadata fields that are set.
+    :type metadata: bool
+    :rtype: Dict
+    """
+    props = obj.properties
+    if properties is not None:
+        props = {name: props[name] for name in properties if name in props}
+    data = {"uuid": obj.uuid, "collection": obj.collection, "properties": props}
+    if metadata and obj.metadata is not None:
+        data["metadata"] = {
+            k: v for k, v in vars(obj.metadata).items() if v is not None
+        }
+    if vector != "omit":
+        data["vector"] = _vector(obj.vector, vector)
+    if obj.references:
+        data["references"] = {
+            name: [
+                object_to_dict(o, None, vector, metadata)
+                for o in reference.objects
+            ]
+            for name, reference in obj.references.items()
+        }
+    for extra in ("belongs_to_group", "generated"):
+        if getattr(obj, extra, None) is not None:
+            data[extra] = getattr(obj, extra)
+    return data
+
+
+def result_to_dict(
+    result: Any,
+    properties: Optional[Sequence[str]] = None,
+    vector: str = "omit",
+    metadata: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    Turn a query or fetch result into a dict ready to be dumped as JSON.
+
+    Handles query results (`objects`), group by results (`groups`),
+    generative results (`generated`), pages (`next`), single objects and None.
+
+    :param result: The result of a query or fetch.
+    :param properties: Only include these properties, None for all.
+    :type properties: Sequence[str] | None
+    :param vector: One of :data:`VECTOR_MODES`.
+    :type vector: str
+    :param metadata: Include the metadata fields that are set.
+    :type metadata: bool
+    :rtype: Dict | None
+    """
+    if vector not in VECTOR_MODES:
+        raise ValueError(
+            f"Unknown vector mode {vector!r}, use one of {', '.join(VECTOR_MODES)}."
+        )
+    if result is None:
+        return None
+    if not hasattr(result, "objects"):
+        return object_to_dict(result, properties, vector, metadata)
+    data = {
+        "objects": [
+            object_to_dict(o, properties, vector, metadata) for o in result.objects
+        ]
+    }
+    if getattr(result, "groups", None) is not None:
+        data["groups"] = {
+            name: {
+                "name": group.name,
+                "min_distance": group.min_distance,
+                "max_distance": group.max_distance,
+                "number_of_objects": group.number_of_objects,
+                "objects": [
+                    object_to_dict(o, properties, vector, metadata)
+                    for o in group.objects
+                ],
+            }
+            for name, group in result.groups.items()
+        }
+    if getattr(result, "generated", None) is not None:
+        data["generated"] = result.generated
+    if hasattr(result, "next_url"):
+        data["next"] = result.next_url
+    return data
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Dump data as compact JSON, with orjson when it is installed.
+
+    :param data: The data to dump.
+    :return: The UTF-8 encoded JSON.
+    :rtype: bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_default)
+    return json.dumps(data, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def to_response(
+    result: Any,
+    properties: Optional[Sequence[str]] = None,
+    vector: str = "omit",
+    metadata: bool = True,
+    status: int = 200,
+) -> Response:
+    """
+    Serialize a query or fetch result into a JSON response.
+
+    :param result: The result of a query or fetch.
+    :param properties: Only include these properties, None for all.
+    :type properties: Sequence[str] | None
+    :param vector: One of :data:`VECTOR_MODES`.
+    :type vector: str
+    :param metadata: Include the metadata fields that are set.
+    :type metadata: bool
+    :param status: The status code of the response.
+    :type status: int
+    :rtype: Response
+    """
+    body = dumps(result_to_dict(result, properties, vector, metadata))
+    return Response(body, status=status, mimetype="application/json")
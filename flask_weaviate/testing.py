@@ -0,0 +1,183 @@
+import shutil
+import uuid
+from pathlib import Path
+from typing import Callable, List, Optional, Union
+
+from weaviate import WeaviateClient
+from weaviate.connect import ConnectionParams
+from weaviate.embedded import EmbeddedOptions, EmbeddedV4, get_random_port
+
+#: Node name of the test instance. Weaviate stores it with the shard
+#: state, so it must not change between a snapshot and its restore.
+CLUSTER_HOSTNAME = "flask-weaviate-test"
+
+
+class EmbeddedWeaviate(object):
+    """
+    An embedded Weaviate instance for a test session, with data snapshots.
+
+    The instance keeps running for the whole session, so tests connect to
+    it instead of starting embedded Weaviate per client. Datasets can be
+    loaded once and saved as a snapshot of the data directory; later
+    sessions restore the snapshot instead of ingesting the data again.
+    A snapshot holds every dataset loaded so far, so loading several
+    datasets in any order ends with all of them.
+
+    :param data_path: The data directory of the instance.
+    :type data_path: str | Path
+    :param snapshot_path: The directory snapshots are stored in.
+    :type snapshot_path: str | Path
+    :param version: The Weaviate version, defaults to the one of
+    EmbeddedOptions.
+    :type version: str | None
+    """
+
+    def __init__(
+        self,
+        data_path: Union[str, Path],
+        snapshot_path: Union[str, Path],
+        version: Optional[str] = None,
+    ):
+        self.data_path = Path(data_path)
+        self.snapshot_path = Path(snapshot_path)
+        options = EmbeddedOptions(
+            persistence_data_path=str(self.data_path),
+            port=get_random_port(),
+            grpc_port=get_random_port(),
+            additional_env_vars={"CLUSTER_HOSTNAME": CLUSTER_HOSTNAME},
+        )
+        if version is not None:
+            options.version = version
+        self.options = options
+        self.db = EmbeddedV4(options)
+        #: The datasets in the data directory.
+        self.datasets: List[str] = []
+
+    @property
+    def connection_params(self) -> ConnectionParams:
+        return ConnectionParams.from_params(
+            http_host=self.options.hostname,
+            http_port=self.options.port,
+            http_secure=False,
+            grpc_host=self.options.hostname,
+            grpc_port=self.options.grpc_port,
+            grpc_secure=False,
+        )
+
+    def start(self) -> None:
+        self.db.ensure_paths_exist()
+        self.db.start()
+
+    def stop(self) -> None:
+        self.db.stop()
+
+    def client(self) -> WeaviateClient:
+        """
+        A connected client; closing it leaves the instance running.
+
+        :rtype: WeaviateClient
+        """
+        client = WeaviateClient(
+            connection_params=self.connection_params, skip_init_checks=True
+        )
+        client.connect()
+        return client
+
+    def _snapshot_dir(self, name: str) -> Path:
+        return self.snapshot_path / f"{name}-{self.options.version}"
+
+    def has_snapshot(self, name: str) -> bool:
+        return self._snapshot_dir(name).is_dir()
+
+    def snapshot(self, name: str) -> None:
+        """
+        Save the data directory as a named snapshot.
+
+        The instance is stopped while copying, so all data is flushed.
+
+        :param name: The name of the snapshot.
+        :type name: str
+        """
+        self.stop()
+        target = self._snapshot_dir(name)
+        shutil.rmtree(target, ignore_errors=True)
+        shutil.copytree(self.data_path, target)
+        self.start()
+
+    def restore(self, name: str) -> None:
+        """
+        Replace the data directory with a named snapshot.
+
+        Everything in the data directory is replaced, including datasets
+        loaded before.
+
+        :param name: The name of the snapshot.
+        :type name: str
+        """
+        self.stop()
+        shutil.rmtree(self.data_path, ignore_errors=True)
+        shutil.copytree(self._snapshot_dir(name), self.data_path)
+        self.start()
+
+    def load_dataset(
+        self, name: str, loader: Callable[[WeaviateClient], None], refresh: bool = False
+    ) -> None:
+        """
+        Add a dataset, restoring it from a snapshot when there is one.
+
+        Snapshots are keyed by all datasets loaded so far: without a
+        snapshot, the loader runs on top of the datasets already loaded and
+        the result is saved; with one, it replaces the data directory.
+        Include a version in the name and bump it when the loader changes.
+
+        :param name: The name of the dataset.
+        :type name: str
+        :param loader: Ingests the dataset with the given client.
+        :type loader: Callable[[WeaviateClient], None]
+        :param refresh: Load the dataset even when there is a snapshot.
+        :type refresh: bool
+        """
+        if name in self.datasets:
+            return
+        datasets = sorted(self.datasets + [name])
+        key = "+".join(datasets)
+        if self.has_snapshot(key) and not refresh:
+            self.restore(key)
+        else:
+            client = self.client()
+            try:
+                loader(client)
+            finally:
+                client.close()
+            self.snapshot(key)
+        self.datasets = datasets
+
+
+class Namespace(object):
+    """
+    A unique collection name prefix isolating the collections of one test.
+
+    The prefix only applies where it is used: through `collection_prefix`
+    in the extension helpers, or :meth:`name` with the client directly.
+
+    :param prefix: The prefix, random when not given.
+    :type prefix: str | None
+    """
+
+    def __init__(self, prefix: Optional[str] = None):
+        # collection names must start with an uppercase letter
+        self.prefix = prefix or f"T{uuid.uuid4().hex[:8]}_"
+
+    def name(self, collection: str) -> str:
+        return self.prefix + collection
+
+    def cleanup(self, client: WeaviateClient) -> None:
+        """
+        Delete all collections of the namespace.
+
+        :param client: A connected client.
+        :type client: WeaviateClient
+        """
+        for name in client.collections.list_all():
+            if name.startswith(self.prefix):
+                client.collections.delete(name)
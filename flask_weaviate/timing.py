@@ -0,0 +1,148 @@
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from flask import g, has_app_context
+
+#: The kinds of Weaviate calls that are reported separately.
+TIMING_KINDS = ("connect", "query", "batch")
+
+#: Logger for calls exceeding the slow query threshold. Every record carries
+#: a `weaviate` attribute with the structured fields of the call.
+slow_query_logger = logging.getLogger("flask_weaviate.slow_query")
+
+_local = threading.local()
+
+
+def sanitize(value, redact: bool = True, max_length: int = 64, max_items: int = 8):
+    """
+    Make call arguments safe and compact for logging.
+
+    Strings, such as search text typed by users, are redacted to their
+    length and a short hash, so equal values can still be correlated.
+    With `redact` off they are only truncated. Numbers are kept, vectors
+    are replaced by their length and any other object, such as a filter,
+    is reduced to its type name, so neither user data, large payloads nor
+    arbitrary object reprs end up in the log.
+
+    :param value: The argument to sanitize.
+    :param redact: Replace strings by their length and hash.
+    :type redact: bool
+    :return: A JSON serializable, shortened version of the value.
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        if redact:
+            digest = hashlib.sha256(value.encode("utf-8")).hexdigest()[:12]
+            return f"<str len={len(value)} sha256={digest}>"
+        if len(value) > max_length:
+            return value[:max_length] + "..."
+        return value
+    if isinstance(value, (list, tuple)):
+        if value and all(isinstance(x, (int, float)) for x in value[:max_items]):
+            if len(value) > max_items:
+                return f"<vector len={len(value)}>"
+        return [sanitize(x, redact, max_length, max_items) for x in value[:max_items]]
+    if isinstance(value, dict):
+        return {
+            str(k): sanitize(v, redact, max_length, max_items)
+            for k, v in list(value.items())[:max_items]
+        }
+    return f"<{type(value).__name__}>"
+
+
+@contextmanager
+def measuring():
+    """
+    Mark the current thread as inside a timed call for the duration of the
+    block, so the calls it makes on the transport are not counted twice.
+    """
+    _local.depth = getattr(_local, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _local.depth -= 1
+
+
+def is_measuring() -> bool:
+    """
+    Whether the current thread is inside a timed call.
+
+    :rtype: bool
+    """
+    return getattr(_local, "depth", 0) > 0
+
+
+def record_timing(kind: str, duration: float) -> None:
+    """
+    Add the duration of a Weaviate call to the current app context.
+
+    :param kind: One of :data:`TIMING_KINDS`.
+    :type kind: str
+    :param duration: The duration in seconds.
+    :type duration: float
+    """
+    if not has_app_context():
+        return
+    timings = g.setdefault("weaviate_timings", {})
+    timings[kind] = timings.get(kind, 0.0) + duration
+
+
+def get_timings() -> Dict[str, float]:
+    """
+    The time spent in Weaviate calls in the current app context.
+
+    :return: Seconds per kind of call.
+    :rtype: Dict[str, float]
+    """
+    if not has_app_context():
+        return {}
+    return dict(g.get("weaviate_timings", {}))
+
+
+def server_timing_header(timings: Dict[str, float]) -> Optional[str]:
+    """
+    Format timings as a `Server-Timing` header value.
+
+    :param timings: Seconds per kind of call.
+    :type timings: Dict[str, float]
+    :return: The header value, or None when no call was made.
+    :rtype: str | None
+    """
+    if not timings:
+        return None
+    metrics = [f"weaviate;dur={sum(timings.values()) * 1000:.1f}"]
+    for kind in TIMING_KINDS:
+        if kind in timings:
+            metrics.append(f"weaviate-{kind};dur={timings[kind] * 1000:.1f}")
+    return ", ".join(metrics)
+
+
+def log_slow_query(
+    kind: str,
+    collection: Optional[str],
+    operation: Optional[str],
+    args: tuple,
+    kwargs: dict,
+    duration: float,
+    redact: bool = True,
+) -> None:
+    fields = {
+        "kind": kind,
+        "collection": collection,
+        "operation": operation,
+        "args": sanitize(list(args), redact),
+        "kwargs": sanitize(kwargs, redact),
+        "duration_ms": round(duration * 1000, 1),
+    }
+    slow_query_logger.warning(
+        "Slow Weaviate %s on %s.%s took %.1f ms",
+        kind,
+        collection,
+        operation,
+        fields["duration_ms"],
+        extra={"weaviate": fields},
+    )
@@ -0,0 +1,300 @@
+import hashlib
+import logging
+import threading
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import httpx
+from weaviate.auth import _ClientCredentials, _ClientPassword
+
+logger = logging.getLogger(__name__)
+
+#: Lifetime assumed for tokens issued without `expires_in`.
+DEFAULT_EXPIRES_IN = 60
+
+
+class TokenUnavailableError(Exception):
+    """
+    Raised instead of fetching a token while a recent fetch failure is cached.
+    """
+
+
+def credentials_key(url: str, credentials) -> Tuple[str, str]:
+    """
+    Identify a server and credentials without keeping the secret around.
+
+    :param url: The HTTP URL of the Weaviate server.
+    :type url: str
+    :param credentials: The credentials to fetch tokens with.
+    :return: The URL and a sha256 of the credentials.
+    :rtype: Tuple[str, str]
+    """
+    return url, hashlib.sha256(repr(credentials).encode("utf-8")).hexdigest()
+
+
+class OidcTokenSource(object):
+    """
+    Fetch access tokens for a Weaviate server from its OIDC provider.
+
+    The provider and client id are discovered from the Weaviate server on
+    first use, like the weaviate client does. Supports the resource owner
+    password and client credentials flows, and refresh tokens.
+
+    :param url: The HTTP URL of the Weaviate server.
+    :type url: str
+    :param credentials: The credentials to fetch tokens with.
+    :type credentials: _ClientPassword | _ClientCredentials
+    :param timeout: Timeout of the requests in seconds.
+    :type timeout: float
+    """
+
+    def __init__(self, url: str, credentials, timeout: float = 5):
+        if not isinstance(credentials, (_ClientPassword, _ClientCredentials)):
+            raise ValueError(
+                "Only username/password and client credentials fetch tokens."
+            )
+        self.url = url.rstrip("/")
+        self.credentials = credentials
+        self.timeout = timeout
+        self._token_endpoint: Optional[str] = None
+        self._client_id: Optional[str] = None
+        self._scopes: List[str] = []
+
+    def _discover(self) -> None:
+        response = httpx.get(
+            f"{self.url}/v1/.well-known/openid-configuration", timeout=self.timeout
+        )
+        response.raise_for_status()
+        oidc_config = response.json()
+        provider = httpx.get(oidc_config["href"], timeout=self.timeout)
+        provider.raise_for_status()
+        self._client_id = oidc_config["clientId"]
+        self._scopes = list(oidc_config.get("scopes", []))
+        self._token_endpoint = provider.json()["token_endpoint"]
+
+    def fetch(self, refresh_token: Optional[str] = None) -> Dict:
+        """
+        Request a new token.
+
+        :param refresh_token: Use this refresh token instead of the credentials.
+        :type refresh_token: str | None
+        :return: The token response, with `access_token` and optionally
+        `expires_in` and `refresh_token`.
+        :rtype: Dict
+        """
+        if self._token_endpoint is None:
+            self._discover()
+        data = {"client_id": self._client_id}
+        scope = " ".join(self._scopes + self.credentials.scope_list)
+        if refresh_token is not None:
+            data.update(grant_type="refresh_token", refresh_token=refresh_token)
+        elif isinstance(self.credentials, _ClientPassword):
+            data.update(
+                grant_type="password",
+                username=self.credentials.username,
+                password=self.credentials.password,
+            )
+        else:
+            data.update(
+                grant_type="client_credentials",
+                client_secret=self.credentials.client_secret,
+            )
+        if scope and refresh_token is None:
+            data["scope"] = scope
+        response = httpx.post(self._token_endpoint, data=data, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+
+class _Token(object):
+    def __init__(self, response: Dict, refresh_margin: float):
+        now = self.issued_at = time.monotonic()
+        expires_in = float(response.get("expires_in") or DEFAULT_EXPIRES_IN)
+        self.access_token: str = response["access_token"]
+        self.refresh_token: Optional[str] = response.get("refresh_token")
+        self.expires_at = now + expires_in
+        # refresh ahead of expiry, but no more often than every half lifetime
+        self.refresh_at = now + max(expires_in - refresh_margin, expires_in / 2)
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+class TokenCache(object):
+    """
+    Share access tokens between clients and refresh them in the background.
+
+    The first request for a token fetches it; after that, a background
+    thread refreshes every token `refresh_margin` seconds before it
+    expires, so request threads keep getting a valid token without
+    waiting for the identity provider. Tokens not requested since they
+    were fetched are not refreshed and are dropped once they expire.
+
+    When fetching a token fails, no new fetch is made for that key for
+    `min_backoff` seconds, doubling with every failure up to
+    `max_backoff`; meanwhile requests get a :class:`TokenUnavailableError`
+    at once, so an identity provider that is down is not flooded.
+
+    :param refresh_margin: Seconds before expiry to refresh a token.
+    :type refresh_margin: float
+    :param min_backoff: Seconds to wait after the first failed fetch.
+    :type min_backoff: float
+    :param max_backoff: Maximum seconds to wait between failed fetches.
+    :type max_backoff: float
+    """
+
+    def __init__(
+        self,
+        refresh_margin: float = 30,
+        min_backoff: float = 5,
+        max_backoff: float = 300,
+    ):
+        self.refresh_margin = refresh_margin
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self._tokens: Dict[Hashable, _Token] = {}
+        self._sources: Dict[Hashable, OidcTokenSource] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        # when each key was last requested, and its failed fetches
+        self._used: Dict[Hashable, float] = {}
+        self._failures: Dict[Hashable, int] = {}
+        self._retry_at: Dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+
+    def access_token(self, key: Hashable, source: OidcTokenSource) -> str:
+        """
+        A valid access token, fetched only when there is none yet.
+
+        :param key: Identifies the server and credentials.
+        :type key: Hashable
+        :param source: Fetches tokens for the key.
+        :type source: OidcTokenSource
+        :return: The access token.
+        :rtype: str
+        :raises TokenUnavailableError: While a failed fetch is backed off.
+        """
+        token = self._tokens.get(key)
+        if token is None or token.expired():
+            with self._lock:
+                self._sources.setdefault(key, source)
+            token = self._renew(key, source)
+            self._used[key] = time.monotonic()
+            self._start_refresher()
+            return token.access_token
+        now = time.monotonic()
+        if self._used.get(key, 0) < token.issued_at and now >= token.refresh_at:
+            # the refresher let this token lapse, wake it to refresh after all
+            self._wakeup.set()
+        self._used[key] = now
+        return token.access_token
+
+    def _renew(self, key: Hashable, source: Optional[OidcTokenSource] = None) -> _Token:
+        with self._lock:
+            lock = self._key_locks.setdefault(key, threading.Lock())
+        with lock:
+            token = self._tokens.get(key)
+            now = time.monotonic()
+            # another thread renewed it while this one waited
+            if token is not None and now < token.refresh_at:
+                return token
+            if now < self._retry_at.get(key, 0):
+                raise TokenUnavailableError(
+                    "Fetching a token failed recently, not retrying yet."
+                )
+            source = source or self._sources[key]
+            try:
+                response = None
+                if token is not None and token.refresh_token is not None:
+                    try:
+                        response = source.fetch(refresh_token=token.refresh_token)
+                    except httpx.HTTPError:
+                        logger.debug("Refresh token rejected, using credentials")
+                if response is None:
+                    response = source.fetch()
+            except Exception:
+                failures = self._failures[key] = self._failures.get(key, 0) + 1
+                backoff = min(self.min_backoff * 2 ** (failures - 1), self.max_backoff)
+                self._retry_at[key] = time.monotonic() + backoff
+                raise
+            self._failures.pop(key, None)
+            self._retry_at.pop(key, None)
+            token = self._tokens[key] = _Token(response, self.refresh_margin)
+        self._wakeup.set()
+        return token
+
+    def _evict(self, key: Hashable) -> None:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is not None and lock.locked():
+                # a request is fetching a token right now
+                return
+            self._tokens.pop(key, None)
+            self._used.pop(key, None)
+            # keep backing off a failing key until its retry time passed
+            if time.monotonic() >= self._retry_at.get(key, 0):
+                self._sources.pop(key, None)
+                self._failures.pop(key, None)
+                self._retry_at.pop(key, None)
+                self._key_locks.pop(key, None)
+
+    def _start_refresher(self) -> None:
+        with self._lock:
+            if self._refresher is None:
+                self._refresher = threading.Thread(
+                    target=self._refresh_loop,
+                    name="flask-weaviate-token-refresh",
+                    daemon=True,
+                )
+                self._refresher.start()
+
+    def _refresh_loop(self) -> None:
+        while True:
+            self._wakeup.clear()
+            delay = self._refresh_once() - time.monotonic()
+            self._wakeup.wait(max(delay, 0.1))
+
+    def _refresh_once(self) -> float:
+        """
+        Refresh the tokens that are due and drop the expired ones.
+
+        :return: When the next token is due, as a monotonic time.
+        :rtype: float
+        """
+        wake_at = []
+        for key in list(self._sources):
+            token = self._tokens.get(key)
+            if token is None or token.expired():
+                # requests fetch expired tokens themselves
+                self._evict(key)
+                retry_at = self._retry_at.get(key)
+                if retry_at is not None:
+                    wake_at.append(retry_at)
+                continue
+            if self._used.get(key, 0) < token.issued_at:
+                # not requested since it was fetched: let it lapse
+                wake_at.append(token.expires_at)
+                continue
+            refresh_at = max(token.refresh_at, self._retry_at.get(key, 0))
+            if time.monotonic() >= refresh_at:
+                try:
+                    token = self._renew(key)
+                except Exception:
+                    logger.warning("Failed to refresh Weaviate access token",
+                                   exc_info=True)
+                refresh_at = max(token.refresh_at, self._retry_at.get(key, 0))
+            wake_at.append(min(refresh_at, token.expires_at))
+        return min(wake_at, default=time.monotonic() + 60)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+            self._sources.clear()
+            self._used.clear()
+            self._failures.clear()
+            self._retry_at.clear()
+
+
+#: The cache shared by every extension in the process.
+token_cache = TokenCache()
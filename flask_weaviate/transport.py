@@ -0,0 +1,159 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Optional
+
+import httpx
+
+#: Wraps a single call on the transport: `around(kind, operation, collection)`.
+Around = Callable[[str, str, Optional[str]], ContextManager]
+
+#: gRPC methods that write, reported as `batch` instead of `query`.
+GRPC_BATCH_METHODS = ("BatchObjects", "BatchDelete")
+
+#: Timeout given to calls made after their deadline, so they fail at once.
+EXPIRED_TIMEOUT = 0.001
+
+_local = threading.local()
+
+
+@contextmanager
+def deadline(at: Optional[float]):
+    """
+    Cap the timeout of the calls made in the block by the current thread.
+
+    Calls made after the deadline get a tiny timeout and fail right away,
+    so a worker running a query nobody waits for anymore is freed.
+
+    :param at: The deadline as a :func:`time.monotonic` value, None for none.
+    :type at: float | None
+    """
+    previous = getattr(_local, "deadline", None)
+    if at is not None and previous is not None:
+        at = min(at, previous)
+    _local.deadline = at if at is not None else previous
+    try:
+        yield
+    finally:
+        _local.deadline = previous
+
+
+def remaining() -> Optional[float]:
+    """
+    Seconds left until the deadline of the current thread.
+
+    :return: The seconds left, negative when passed, None without deadline.
+    :rtype: float | None
+    """
+    at = getattr(_local, "deadline", None)
+    if at is None:
+        return None
+    return at - time.monotonic()
+
+
+def run_until(at: Optional[float], func: Callable, *args):
+    """
+    Run `func` with a deadline, e.g. in a worker thread.
+
+    :param at: The deadline as a :func:`time.monotonic` value, None for none.
+    :type at: float | None
+    :param func: The function to run.
+    :type func: Callable
+    :return: The return value of `func`.
+    """
+    with deadline(at):
+        return func(*args)
+
+
+def _cap(timeout: Optional[float]) -> Optional[float]:
+    left = remaining()
+    if left is None:
+        return timeout
+    left = max(left, EXPIRED_TIMEOUT)
+    return left if timeout is None else min(timeout, left)
+
+
+class _HTTPTransport(httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport, around: Around):
+        self.transport = transport
+        self.around = around
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        kind = "batch" if path.startswith("/v1/batch/") else "query"
+        if remaining() is not None:
+            timeout = dict(request.extensions.get("timeout", {}))
+            for name in ("connect", "read", "write", "pool"):
+                timeout[name] = _cap(timeout.get(name))
+            request.extensions["timeout"] = timeout
+        with self.around(kind, f"{request.method} {path}", None):
+            return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class _GrpcMethod(object):
+    def __init__(self, method, name: str, around: Around):
+        self.method = method
+        self.name = name
+        self.around = around
+
+    def _call(self, invoke, request, **kwargs):
+        kind = "batch" if self.name in GRPC_BATCH_METHODS else "query"
+        collection = getattr(request, "collection", None) or None
+        if remaining() is not None:
+            kwargs["timeout"] = _cap(kwargs.get("timeout"))
+        with self.around(kind, self.name, collection):
+            return invoke(request, **kwargs)
+
+    def __call__(self, request, **kwargs):
+        return self._call(self.method, request, **kwargs)
+
+    def with_call(self, request, **kwargs):
+        return self._call(self.method.with_call, request, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.method, name)
+
+
+class _GrpcStub(object):
+    def __init__(self, stub, around: Around):
+        self._stub = stub
+        self._around = around
+
+    def __getattr__(self, name):
+        method = getattr(self._stub, name)
+        return _GrpcMethod(method, name, self._around)
+
+
+def instrument_client(client, around: Around) -> None:
+    """
+    Run every HTTP and gRPC call of a connected client through `around`.
+
+    Wraps the transports of the client's httpx session and its gRPC stub,
+    so calls made directly on the client, e.g.
+    `client.collections.get("Article").query.bm25(...)`, are seen by the
+    extension too, and their timeouts are capped by :func:`deadline`.
+    Clients without these internals are left alone.
+
+    :param client: A connected client.
+    :type client: WeaviateClient
+    :param around: Context manager factory wrapping each call.
+    :type around: Callable[[str, str, str | None], ContextManager]
+    """
+    connection = getattr(client, "_connection", None)
+    if connection is None or getattr(connection, "_flask_weaviate", False):
+        return
+    session = getattr(connection, "_client", None)
+    if isinstance(session, httpx.Client):
+        session._transport = _HTTPTransport(session._transport, around)
+        session._mounts = {
+            pattern: _HTTPTransport(transport, around)
+            if transport is not None
+            else None
+            for pattern, transport in session._mounts.items()
+        }
+    if getattr(connection, "_grpc_stub", None) is not None:
+        connection._grpc_stub = _GrpcStub(connection._grpc_stub, around)
+    connection._flask_weaviate = True
@@ -0,0 +1,67 @@
+import pytest
+
+
+@pytest.fixture
+def app():
+    from flask import Flask
+    app = Flask(__name__)
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture
+def fake_client(app):
+    """
+    A stand-in for a connected WeaviateClient stored on `g`, so the
+    extension helpers can be tested without a running Weaviate.
+    """
+    from unittest import mock
+    from flask import g
+
+    client = mock.MagicMock()
+    client.is_connected.return_value = True
+    g.weaviate_client = client
+    return client
+
+
+class FakeWeaviateClient(object):
+    """
+    A stand-in for the WeaviateClient class that records how it is used.
+    """
+
+    instances = []
+    fail_connect = False
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.connected = False
+        self.closed = False
+        FakeWeaviateClient.instances.append(self)
+
+    def connect(self):
+        if FakeWeaviateClient.fail_connect:
+            from weaviate.exceptions import WeaviateStartUpError
+            raise WeaviateStartUpError("connection refused")
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    def close(self):
+        self.connected = False
+        self.closed = True
+
+    def get_meta(self):
+        return {"version": "1.23.7", "modules": {}}
+
+
+@pytest.fixture
+def fake_weaviate_client(monkeypatch):
+    from flask_weaviate import server_meta_cache
+
+    FakeWeaviateClient.instances = []
+    FakeWeaviateClient.fail_connect = False
+    server_meta_cache.clear()
+    monkeypatch.setattr("flask_weaviate.WeaviateClient", FakeWeaviateClient)
+    yield FakeWeaviateClient
+    server_meta_cache.clear()
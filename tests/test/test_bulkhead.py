@@ -0,0 +1,183 @@
+import threading
+
+import pytest
+
+
+def test_bulkhead_rejects_when_full():
+    from flask_weaviate import Bulkhead, BulkheadFullError
+
+    bulkhead = Bulkhead(max_concurrent=1, max_wait=0)
+    errors = []
+
+    def call():
+        try:
+            with bulkhead.limit():
+                pass
+        except BulkheadFullError as e:
+            errors.append(e)
+
+    with bulkhead.limit():
+        assert bulkhead.stats["in_flight"] == 1
+        thread = threading.Thread(target=call)
+        thread.start()
+        thread.join()
+    assert errors[0].code == 503
+
+    assert bulkhead.stats["in_flight"] == 0
+    assert bulkhead.stats["accepted"] == 1
+    assert bulkhead.stats["rejected"] == 1
+
+
+def test_bulkhead_waits_for_slot():
+    from flask_weaviate import Bulkhead
+
+    bulkhead = Bulkhead(max_concurrent=1, max_wait=5)
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with bulkhead.limit():
+            holding.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    holding.wait(5)
+    threading.Timer(0.05, release.set).start()
+
+    with bulkhead.limit():
+        pass
+    thread.join()
+
+    assert bulkhead.stats["accepted"] == 2
+    assert bulkhead.stats["rejected"] == 0
+    assert bulkhead.stats["queue_wait_max"] > 0
+
+
+def test_bulkhead_unlimited():
+    from flask_weaviate import Bulkhead
+
+    bulkhead = Bulkhead()
+    with bulkhead.limit():
+        assert bulkhead.stats["in_flight"] == 1
+
+
+def test_bulkhead_reentrant():
+    from flask_weaviate import Bulkhead
+
+    bulkhead = Bulkhead(max_concurrent=1, max_wait=0)
+    with bulkhead.limit():
+        # calls made while holding the slot do not need another one
+        with bulkhead.limit():
+            assert bulkhead.stats["in_flight"] == 1
+    with bulkhead.limit():
+        pass
+
+    assert bulkhead.stats["accepted"] == 2
+    assert bulkhead.stats["in_flight"] == 0
+
+
+def test_bulkhead_invalid():
+    from flask_weaviate import Bulkhead
+
+    with pytest.raises(ValueError):
+        Bulkhead(max_concurrent=0)
+
+
+def test_query_saturated_returns_503(app, fake_client):
+    from flask import jsonify
+    from flask_weaviate import FlaskWeaviate
+
+    app.config['WEAVIATE_MAX_CONCURRENT_CALLS'] = 1
+    app.config['WEAVIATE_MAX_QUEUE_WAIT'] = 0
+    weaviate = FlaskWeaviate(app)
+
+    @app.route('/search')
+    def search_endpoint():
+        weaviate.query("Article", "bm25", query="flask")
+        return jsonify({"result": "ok"}), 200
+
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with weaviate.bulkhead.limit():
+            holding.set()
+            release.wait(5)
+
+    with app.test_client() as client:
+        assert client.get('/search').status_code == 200
+        thread = threading.Thread(target=hold)
+        thread.start()
+        holding.wait(5)
+        assert client.get('/search').status_code == 503
+        release.set()
+        thread.join()
+
+    assert weaviate.bulkhead_stats["rejected"] == 1
+    assert weaviate.bulkhead_stats["accepted"] == 2
+
+
+def test_direct_client_calls_limited(app):
+    from types import SimpleNamespace
+    from flask_weaviate import BulkheadFullError, FlaskWeaviate
+    from flask_weaviate.transport import instrument_client
+
+    weaviate = FlaskWeaviate(app, max_concurrent_calls=1, max_queue_wait=0)
+    holding = threading.Event()
+    release = threading.Event()
+
+    def search(request, timeout=None):
+        holding.set()
+        release.wait(5)
+
+    stub = SimpleNamespace(Search=search)
+    client = SimpleNamespace(_connection=SimpleNamespace(_grpc_stub=stub))
+    instrument_client(client, weaviate._transport_call)
+
+    def call():
+        with app.app_context():
+            client._connection._grpc_stub.Search(None)
+
+    thread = threading.Thread(target=call)
+    thread.start()
+    holding.wait(5)
+    with pytest.raises(BulkheadFullError):
+        client._connection._grpc_stub.Search(None)
+    release.set()
+    thread.join()
+
+    assert weaviate.bulkhead_stats["accepted"] == 1
+    assert weaviate.bulkhead_stats["rejected"] == 1
+
+
+def test_background_calls_not_limited(app):
+    from types import SimpleNamespace
+    from flask_weaviate import FlaskWeaviate
+    from flask_weaviate.transport import instrument_client
+
+    weaviate = FlaskWeaviate(app, max_concurrent_calls=1, max_queue_wait=0)
+    calls = []
+    errors = []
+    stub = SimpleNamespace(Search=lambda request, timeout=None: calls.append(request))
+    client = SimpleNamespace(_connection=SimpleNamespace(_grpc_stub=stub))
+    instrument_client(client, weaviate._transport_call)
+
+    def scheduler():
+        # like the batch scheduler of the client, without an app context
+        try:
+            client._connection._grpc_stub.Search("nodes")
+        except Exception as e:
+            errors.append(e)
+
+    # the request holds the only slot for a whole batch
+    with weaviate.bulkhead.limit():
+        thread = threading.Thread(target=scheduler)
+        thread.start()
+        thread.join()
+        client._connection._grpc_stub.Search("batch")
+
+    assert errors == []
+    assert calls == ["nodes", "batch"]
+    assert weaviate.bulkhead_stats["accepted"] == 1
+    assert weaviate.bulkhead_stats["rejected"] == 0
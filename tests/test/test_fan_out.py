@@ -0,0 +1,147 @@
+import threading
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+
+def make_result(*scores, distance=False):
+    objects = []
+    for score in scores:
+        metadata = SimpleNamespace(score=None, distance=None, certainty=None)
+        if distance:
+            metadata.distance = score
+        else:
+            metadata.score = score
+        objects.append(SimpleNamespace(uuid=uuid4(), metadata=metadata))
+    return SimpleNamespace(objects=objects)
+
+
+def test_reciprocal_rank_fusion():
+    from flask_weaviate import reciprocal_rank_fusion
+
+    articles = make_result(3.0, 2.0)
+    pages = make_result(0.1)
+    fused = reciprocal_rank_fusion({"Article": articles, "Page": pages})
+
+    assert [f.collection for f in fused][:2] == ["Article", "Page"]
+    assert fused[0].score == pytest.approx(1 / 61)
+    assert fused[2].object is articles.objects[1]
+    assert fused[2].score == pytest.approx(1 / 62)
+
+
+def test_score_fusion():
+    from flask_weaviate import score_fusion
+
+    articles = make_result(10.0, 5.0, 0.0)
+    pages = make_result(0.1, 0.3, distance=True)
+    fused = score_fusion({"Article": articles, "Page": pages})
+
+    scores = {id(f.object): f.score for f in fused}
+    assert scores[id(articles.objects[1])] == pytest.approx(0.5)
+    assert scores[id(pages.objects[0])] == pytest.approx(1.0)
+    assert scores[id(pages.objects[1])] == pytest.approx(0.0)
+
+
+def test_fan_out_runs_concurrently(app, fake_client):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app)
+    barrier = threading.Barrier(3, timeout=5)
+    results = {name: make_result(1.0) for name in ["Article", "Page", "Product"]}
+
+    def get(name):
+        def hybrid(**kwargs):
+            # all three queries must be in flight at the same time
+            barrier.wait()
+            assert kwargs == {"query": "flask", "limit": 2, **overrides.get(name, {})}
+            return results[name]
+        return SimpleNamespace(query=SimpleNamespace(hybrid=hybrid))
+
+    overrides = {"Page": {"alpha": 0.2}}
+    fake_client.collections.get.side_effect = get
+
+    result = weaviate.fan_out(
+        {"Article": {}, "Page": overrides["Page"], "Product": {}},
+        query="flask", limit=2,
+    )
+
+    assert not result.partial
+    assert list(result.results) == ["Article", "Page", "Product"]
+    assert len(result.objects) == 2
+
+
+def test_fan_out_partial_results(app, fake_client):
+    from flask_weaviate import FlaskWeaviate, RetryBudget, RetryPolicy
+
+    weaviate = FlaskWeaviate(app, retry_policy=RetryPolicy(budget=RetryBudget()))
+    release = threading.Event()
+
+    def get(name):
+        def bm25(**kwargs):
+            if name == "Slow":
+                release.wait(5)
+            if name == "Broken":
+                raise ValueError("no such collection")
+            return make_result(1.0, 0.5)
+        return SimpleNamespace(query=SimpleNamespace(bm25=bm25))
+
+    fake_client.collections.get.side_effect = get
+
+    start = time.perf_counter()
+    result = weaviate.fan_out(
+        ["Article", "Slow", "Broken"], "bm25", fusion="score", timeout=0.2,
+        query="flask",
+    )
+    release.set()
+
+    assert time.perf_counter() - start < 2
+    assert result.partial
+    assert result.timed_out == ["Slow"]
+    assert isinstance(result.errors["Broken"], ValueError)
+    assert list(result.results) == ["Article"]
+    assert [f.score for f in result.objects] == [1.0, 0.0]
+
+
+def test_fan_out_keeps_client_open_for_timed_out_queries(app, fake_client):
+    from flask import g
+    from flask_weaviate import FlaskWeaviate
+    from flask_weaviate.transport import remaining
+
+    weaviate = FlaskWeaviate(app)
+    release = threading.Event()
+    seen = {}
+
+    def get(name):
+        def bm25(**kwargs):
+            seen["remaining"] = remaining()
+            release.wait(5)
+            seen["closed_while_running"] = fake_client.close.called
+            return make_result(1.0)
+        return SimpleNamespace(query=SimpleNamespace(bm25=bm25))
+
+    fake_client.collections.get.side_effect = get
+
+    result = weaviate.fan_out(["Slow"], "bm25", timeout=0.05, query="flask")
+    assert result.timed_out == ["Slow"]
+    # the query runs with the fan-out timeout as its deadline
+    assert 0 < seen["remaining"] <= 0.05
+
+    # teardown no longer owns the client
+    assert g.get("weaviate_client") is None
+    app.do_teardown_appcontext()
+    assert not fake_client.close.called
+
+    release.set()
+    weaviate.executor.shutdown(wait=True)
+    assert seen["closed_while_running"] is False
+    fake_client.close.assert_called_once()
+
+
+def test_fan_out_unknown_fusion(app):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app)
+    with pytest.raises(ValueError):
+        weaviate.fan_out(["Article"], fusion="borda")
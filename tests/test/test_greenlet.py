@@ -0,0 +1,79 @@
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+
+def test_detect_monkey_patching(monkeypatch):
+    from flask_weaviate import detect_monkey_patching
+
+    monkeypatch.delitem(sys.modules, "gevent.monkey", raising=False)
+    monkeypatch.delitem(sys.modules, "eventlet.patcher", raising=False)
+    assert detect_monkey_patching() is None
+
+    monkeypatch.setitem(sys.modules, "eventlet.patcher", SimpleNamespace(
+        is_monkey_patched=lambda module: module == "socket"))
+    assert detect_monkey_patching() == "eventlet"
+
+    monkeypatch.setitem(sys.modules, "gevent.monkey", SimpleNamespace(
+        is_module_patched=lambda module: module == "socket"))
+    assert detect_monkey_patching() == "gevent"
+
+
+def test_shared_client_pool(fake_weaviate_client):
+    from flask_weaviate import SharedClientPool
+
+    def factory():
+        client = fake_weaviate_client()
+        client.connect()
+        return client
+
+    pool = SharedClientPool(factory, size=2)
+    clients = [pool.get() for _ in range(6)]
+
+    assert len({id(c) for c in clients}) == 2
+    assert clients[0] is clients[2] is clients[4]
+
+    # a disconnected client is replaced
+    clients[1].close()
+    assert pool.get() is clients[0]
+    assert pool.get() is not clients[1]
+
+    pool.close()
+    assert clients[0].closed
+
+    with pytest.raises(ValueError):
+        SharedClientPool(factory, size=0)
+
+
+def test_greenlet_mode_shares_clients(app, fake_weaviate_client):
+    from flask import g
+    from flask_weaviate import FlaskWeaviate
+
+    app.config['WEAVIATE_GREENLET_MODE'] = True
+    app.config['WEAVIATE_POOL_SIZE'] = 2
+    weaviate = FlaskWeaviate(app)
+    assert weaviate.cooperative
+
+    clients = []
+    for _ in range(10):
+        with app.app_context():
+            clients.append(weaviate.client)
+            assert g.weaviate_shared
+
+    assert len(fake_weaviate_client.instances) == 2
+    assert len({id(c) for c in clients}) == 2
+    # teardown keeps the shared clients open
+    assert all(c.is_connected() for c in clients)
+
+
+def test_greenlet_mode_disabled(app, fake_weaviate_client):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app, greenlet_mode=False)
+    assert not weaviate.cooperative
+
+    with app.app_context():
+        client = weaviate.client
+
+    assert client.closed
@@ -0,0 +1,133 @@
+import pytest
+
+
+def test_bind_key():
+    from flask_weaviate import bind_key
+    from weaviate.connect import ConnectionParams
+    from weaviate.embedded import EmbeddedOptions
+
+    params = ConnectionParams.from_params(
+        http_host="weaviate", http_port=8080, http_secure=False,
+        grpc_host="weaviate", grpc_port=50051, grpc_secure=False,
+    )
+    assert bind_key({"connection_params": params}) == (
+        "http", "weaviate", 8080, False, "weaviate", 50051
+    )
+    assert bind_key({"connection_params": None, "embedded_options": EmbeddedOptions()})[0] == "embedded"
+
+
+def test_server_meta_cache_ttl(monkeypatch):
+    from flask_weaviate import ServerMetaCache
+
+    now = [100.0]
+    monkeypatch.setattr("flask_weaviate.init_checks.time.monotonic", lambda: now[0])
+    cache = ServerMetaCache()
+    cache.set(("http",), {"version": "1.23.7"})
+
+    assert cache.get(("http",), ttl=10) == {"version": "1.23.7"}
+    now[0] += 11
+    assert cache.get(("http",), ttl=10) is None
+    assert cache.get(("http",), ttl=None) == {"version": "1.23.7"}
+
+    cache.invalidate(("http",))
+    assert cache.get(("http",), ttl=None) is None
+
+
+def test_init_checks_run_once(app, fake_weaviate_client):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app)
+    for _ in range(3):
+        with app.app_context():
+            assert weaviate.client.is_connected()
+
+    skipped = [c.kwargs["skip_init_checks"] for c in fake_weaviate_client.instances]
+    assert skipped == [False, True, True]
+
+
+def test_init_checks_not_cached_when_skipped_or_disabled(app, fake_weaviate_client):
+    from flask_weaviate import FlaskWeaviate
+
+    app.config['WEAVIATE_INIT_CHECKS_TTL'] = 0
+    weaviate = FlaskWeaviate(app)
+    for _ in range(2):
+        with app.app_context():
+            weaviate.client
+
+    skipped = [c.kwargs["skip_init_checks"] for c in fake_weaviate_client.instances]
+    assert skipped == [False, False]
+
+
+def test_stale_init_checks_refreshed(app, fake_weaviate_client, monkeypatch):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app)
+    with app.app_context():
+        weaviate.client
+
+    # the first connect without checks fails, the cache is dropped and
+    # a client with checks is connected instead
+    original_connect = fake_weaviate_client.connect
+
+    def connect(self):
+        if self.kwargs["skip_init_checks"]:
+            raise ConnectionError("server replaced")
+        original_connect(self)
+
+    monkeypatch.setattr(fake_weaviate_client, "connect", connect)
+    with app.app_context():
+        assert weaviate.client.is_connected()
+        assert weaviate.client.kwargs["skip_init_checks"] is False
+
+    first, stale, fresh = fake_weaviate_client.instances
+    assert stale.closed
+
+
+def test_failed_replacement_closed(app, fake_weaviate_client, monkeypatch):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app)
+    with app.app_context():
+        weaviate.client
+
+    def connect(self):
+        raise ConnectionError("server down")
+
+    monkeypatch.setattr(fake_weaviate_client, "connect", connect)
+    with app.app_context():
+        with pytest.raises(ConnectionError):
+            weaviate.client
+
+    first, stale, replacement = fake_weaviate_client.instances
+    assert stale.closed
+    assert replacement.closed
+
+
+def test_failed_checks_are_not_cached(app, fake_weaviate_client):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app)
+    fake_weaviate_client.fail_connect = True
+    with app.app_context():
+        with pytest.raises(Exception) as e:
+            weaviate.client
+        assert str(e.value) == "Failed to connect to Weaviate server"
+
+    fake_weaviate_client.fail_connect = False
+    with app.app_context():
+        weaviate.client
+
+    skipped = [c.kwargs["skip_init_checks"] for c in fake_weaviate_client.instances]
+    assert skipped == [False, False]
+
+
+def test_server_meta_cached(app, fake_weaviate_client):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app)
+    with app.app_context():
+        assert weaviate.server_meta["version"] == "1.23.7"
+    with app.app_context():
+        assert weaviate.server_meta["version"] == "1.23.7"
+        # answered from the cache, without creating a client
+        assert weaviate._client is None
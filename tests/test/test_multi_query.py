@@ -0,0 +1,100 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+
+def test_query_spec_create():
+    from flask_weaviate import QuerySpec
+
+    spec = QuerySpec.create({"collection": "Article", "operation": "bm25",
+                             "kwargs": {"query": "flask"}})
+    assert spec == QuerySpec("Article", "bm25", (), {"query": "flask"})
+    assert QuerySpec.create(spec) is spec
+
+    with pytest.raises(ValueError):
+        QuerySpec.create({"collection": "Article"})
+    for operation in ("__setattr__", "_connection", "bm25()", 42):
+        with pytest.raises(ValueError):
+            QuerySpec.create({"collection": "Article", "operation": operation})
+
+
+def test_multi_query_order_and_errors(app, fake_client):
+    from flask_weaviate import FlaskWeaviate, QuerySpec
+
+    weaviate = FlaskWeaviate(app)
+
+    def near_vector(vector, limit):
+        # finish in reverse order to check results keep the input order
+        time.sleep(0.01 * (5 - vector[0]))
+        if vector[0] == 3:
+            raise ValueError("bad vector")
+        return vector[0]
+
+    fake_client.collections.get.return_value.query.near_vector.side_effect = near_vector
+
+    outcomes = weaviate.multi_query(
+        [QuerySpec("Article", "near_vector", ([i],), {"limit": 1}) for i in range(5)],
+        concurrency=5,
+    )
+
+    assert [o.result for o in outcomes] == [0, 1, 2, None, 4]
+    assert [o.ok for o in outcomes] == [True, True, True, False, True]
+    assert isinstance(outcomes[3].error, ValueError)
+    assert outcomes[3].spec.args == ([3],)
+
+
+def test_multi_query_invalid_specs(app, fake_client):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app)
+    query = fake_client.collections.get.return_value.query
+    query.bm25.return_value = "result"
+    invalid = [{"collection": "Article"}, {"collection": "A", "operation": "__setattr__"}]
+
+    outcomes = weaviate.multi_query(
+        [{"collection": "Article", "operation": "bm25"}, *invalid]
+    )
+
+    assert [o.ok for o in outcomes] == [True, False, False]
+    assert outcomes[0].result == "result"
+    assert [o.spec for o in outcomes[1:]] == invalid
+    assert all(isinstance(o.error, ValueError) for o in outcomes[1:])
+
+
+def test_multi_query_bounded_concurrency(app, fake_client):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app, max_workers=8)
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def bm25(query):
+        with lock:
+            in_flight.append(query)
+            peak.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(query)
+        return query
+
+    fake_client.collections.get.return_value.query.bm25.side_effect = bm25
+
+    outcomes = weaviate.multi_query(
+        [{"collection": "Article", "operation": "bm25", "kwargs": {"query": str(i)}}
+         for i in range(20)],
+        concurrency=2,
+    )
+
+    assert [o.result for o in outcomes] == [str(i) for i in range(20)]
+    assert max(peak) <= 2
+    # the client of the app context is shared by all queries
+    assert fake_client.collections.get.call_count == 20
+
+
+def test_multi_query_empty(app):
+    from flask_weaviate import FlaskWeaviate
+
+    assert FlaskWeaviate(app).multi_query([]) == []
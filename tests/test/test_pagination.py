@@ -0,0 +1,130 @@
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+
+
+@pytest.fixture
+def articles(app, fake_client):
+    """
+    Serve 5 objects through fetch_objects, honouring `limit` and `after`.
+    """
+    app.secret_key = "secret"
+    objects = sorted(
+        (SimpleNamespace(uuid=uuid4(), metadata=None, properties={"n": n},
+                         references=None, vector={}, collection="Article")
+         for n in range(5)),
+        key=lambda o: str(o.uuid),
+    )
+
+    def fetch_objects(limit, after):
+        start = 0
+        if after is not None:
+            start = [o.uuid for o in objects].index(after) + 1
+        return SimpleNamespace(objects=objects[start:start + limit])
+
+    fake_client.collections.get.return_value.query.fetch_objects.side_effect = fetch_objects
+    return objects
+
+
+def test_cursor_roundtrip(app):
+    from flask_weaviate import InvalidCursorError, dump_cursor, load_cursor
+
+    app.secret_key = "secret"
+    after = uuid4()
+    token = dump_cursor("Article", after)
+
+    assert load_cursor(token, "Article") == after
+
+    with pytest.raises(InvalidCursorError):
+        load_cursor(token, "Page")
+    with pytest.raises(InvalidCursorError):
+        load_cursor(token + "x", "Article")
+    with pytest.raises(InvalidCursorError):
+        load_cursor("garbage", "Article")
+
+
+def test_cursor_requires_secret_key(app):
+    from flask_weaviate import dump_cursor
+
+    with pytest.raises(RuntimeError):
+        dump_cursor("Article", uuid4())
+
+
+def test_paginate(app, articles):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app)
+
+    @app.route('/articles')
+    def list_articles():
+        return weaviate.to_response(weaviate.paginate("Article", limit=2))
+
+    seen = []
+    url = '/articles?tag=a&tag=b'
+    with app.test_client() as client:
+        while url is not None:
+            body = client.get(url).json
+            seen.extend(UUID(o["uuid"]) for o in body["objects"])
+            url = body["next"]
+            assert url is None or url.startswith('/articles?')
+            # repeated arguments are all kept
+            assert url is None or "tag=a&tag=b" in url
+
+    assert seen == [o.uuid for o in articles]
+
+
+def test_paginate_reserved_args(app, articles):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app)
+
+    @app.route('/<kind>/articles')
+    def list_articles(kind):
+        return weaviate.to_response(weaviate.paginate("Article", limit=2))
+
+    query = "_anchor=x&_method=POST&_external=1&_scheme=x&endpoint=x&kind=y"
+    with app.test_client() as client:
+        response = client.get(f'/news/articles?{query}')
+        assert response.status_code == 200
+        url = response.json["next"]
+
+    # the arguments are kept as they are, and the link stays relative
+    assert url.startswith(f'/news/articles?{query}&cursor=')
+
+
+def test_paginate_invalid_cursor(app, articles):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app)
+
+    @app.route('/articles')
+    def list_articles():
+        return weaviate.to_response(weaviate.paginate("Article", limit=2))
+
+    with app.test_client() as client:
+        assert client.get('/articles?cursor=forged').status_code == 400
+
+
+def test_paginate_last_page(app, articles):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app)
+
+    with app.test_request_context('/?cursor=x'):
+        page = weaviate.paginate("Article", limit=10, cursor_arg="page")
+
+    assert len(page.objects) == 5
+    assert page.next_cursor is None
+    assert page.next_url is None
+
+
+def test_paginate_rejects_filters(app, articles):
+    from flask_weaviate import FlaskWeaviate
+    from weaviate.classes.query import Filter
+
+    weaviate = FlaskWeaviate(app)
+
+    with app.test_request_context('/'):
+        with pytest.raises(ValueError):
+            weaviate.paginate("Article", filters=Filter.by_property("n").equal(1))
@@ -0,0 +1,117 @@
+pytest_plugins = ["pytester"]
+
+CONFTEST = '''
+import pytest
+
+pytest_plugins = ["flask_weaviate.pytest_plugin"]
+
+LOADS = {loads!r}
+
+
+class FakeEmbeddedV4(object):
+    def __init__(self, options):
+        self.options = options
+
+    def ensure_paths_exist(self):
+        import os
+        os.makedirs(self.options.persistence_data_path, exist_ok=True)
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class DirClient(object):
+    """Stores each collection as a directory of the data path."""
+
+    def __init__(self, path):
+        self.path = path
+        self.collections = self
+
+    def create(self, name):
+        (self.path / name).mkdir()
+
+    def list_all(self):
+        return {{p.name: None for p in self.path.iterdir() if p.is_dir()}}
+
+    def delete(self, name):
+        import shutil
+        shutil.rmtree(self.path / name)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fake_weaviate():
+    import flask_weaviate.testing as testing
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(testing, "EmbeddedV4", FakeEmbeddedV4)
+        mp.setattr(
+            testing.EmbeddedWeaviate, "client", lambda self: DirClient(self.data_path)
+        )
+        yield
+
+
+def loader(collection):
+    def load(client):
+        with open(LOADS, "a") as f:
+            f.write(collection + "\\n")
+        client.collections.create(collection)
+    return load
+
+
+@pytest.fixture(scope="session")
+def articles(weaviate_dataset):
+    weaviate_dataset("articles-v1", loader("Article"))
+
+
+@pytest.fixture(scope="session")
+def users(weaviate_dataset):
+    weaviate_dataset("users-v1", loader("User"))
+'''
+
+TESTS = '''
+def test_datasets(articles, users, weaviate_embedded):
+    client = weaviate_embedded.client()
+    assert set(client.collections.list_all()) == {"Article", "User"}
+
+
+def test_namespace(weaviate_namespace, weaviate_embedded, weaviate_namespaced_app_config):
+    assert weaviate_namespaced_app_config["WEAVIATE_COLLECTION_PREFIX"] == (
+        weaviate_namespace.prefix
+    )
+    client = weaviate_embedded.client()
+    client.collections.create(weaviate_namespace.name("Article"))
+
+
+def test_namespace_cleaned_up(weaviate_embedded):
+    names = weaviate_embedded.client().collections.list_all()
+    assert not [name for name in names if name.startswith("T")]
+
+
+def test_app_config(weaviate_embedded, weaviate_app_config):
+    assert weaviate_app_config == {
+        "WEAVIATE_CONNECTION_PARAMS": weaviate_embedded.connection_params,
+        "WEAVIATE_SKIP_INIT_CHECKS": True,
+    }
+'''
+
+
+def test_plugin_fixtures(pytester):
+    loads = pytester.path / "loads.txt"
+    pytester.makeconftest(CONFTEST.format(loads=str(loads)))
+    pytester.makepyfile(TESTS)
+
+    pytester.runpytest().assert_outcomes(passed=4)
+    assert loads.read_text().split() == ["Article", "User"]
+
+    # the next run restores the snapshot instead of loading again
+    pytester.runpytest().assert_outcomes(passed=4)
+    assert loads.read_text().split() == ["Article", "User"]
+
+    pytester.runpytest("--weaviate-refresh-snapshots").assert_outcomes(passed=4)
+    assert loads.read_text().split() == ["Article", "User"] * 2
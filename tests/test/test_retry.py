@@ -0,0 +1,198 @@
+import grpc
+import httpx
+import pytest
+
+
+class FakeRpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._code.name
+
+
+def flaky(failures, exc):
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise exc
+        return "ok"
+
+    func.calls = calls
+    return func
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr("flask_weaviate.retry.time.sleep", lambda s: None)
+
+
+def test_is_transient():
+    from weaviate.exceptions import WeaviateQueryError
+    from flask_weaviate import is_transient
+
+    assert is_transient(FakeRpcError(grpc.StatusCode.UNAVAILABLE))
+    assert not is_transient(FakeRpcError(grpc.StatusCode.INVALID_ARGUMENT))
+    assert is_transient(httpx.ConnectError("connection reset"))
+    assert is_transient(WeaviateQueryError("Socket closed", "GRPC search"))
+    assert not is_transient(WeaviateQueryError("no such class", "GRPC search"))
+    assert not is_transient(ValueError())
+
+
+def test_is_transient_query_error_context():
+    from weaviate.exceptions import WeaviateQueryError
+    from flask_weaviate import is_transient
+
+    try:
+        try:
+            raise FakeRpcError(grpc.StatusCode.UNAVAILABLE)
+        except grpc.RpcError as e:
+            raise WeaviateQueryError(e.details(), "GRPC search")
+    except WeaviateQueryError as e:
+        assert is_transient(e)
+
+
+def test_retry_policy_recovers():
+    from flask_weaviate import RetryBudget, RetryPolicy
+
+    policy = RetryPolicy(max_attempts=3, budget=RetryBudget())
+    func = flaky(2, FakeRpcError(grpc.StatusCode.UNAVAILABLE))
+
+    assert policy.call(func) == "ok"
+    assert len(func.calls) == 3
+    assert policy.stats == {"calls": 1, "retries": 2, "exhausted": 0, "throttled": 0}
+
+
+def test_retry_policy_exhausted():
+    from flask_weaviate import RetryBudget, RetryPolicy
+
+    policy = RetryPolicy(max_attempts=2, budget=RetryBudget())
+    func = flaky(5, FakeRpcError(grpc.StatusCode.UNAVAILABLE))
+
+    with pytest.raises(grpc.RpcError):
+        policy.call(func)
+    assert len(func.calls) == 2
+    assert policy.stats["exhausted"] == 1
+
+
+def test_retry_policy_stops_at_deadline():
+    import time
+    from flask_weaviate import RetryBudget, RetryPolicy
+    from flask_weaviate.transport import deadline
+
+    policy = RetryPolicy(max_attempts=5, budget=RetryBudget())
+    func = flaky(5, FakeRpcError(grpc.StatusCode.DEADLINE_EXCEEDED))
+
+    with deadline(time.monotonic() - 1):
+        with pytest.raises(grpc.RpcError):
+            policy.call(func)
+    assert len(func.calls) == 1
+    assert policy.stats["exhausted"] == 1
+
+
+def test_retry_policy_does_not_retry_permanent_errors():
+    from flask_weaviate import RetryBudget, RetryPolicy
+
+    policy = RetryPolicy(budget=RetryBudget())
+    func = flaky(1, ValueError("bad filter"))
+
+    with pytest.raises(ValueError):
+        policy.call(func)
+    assert len(func.calls) == 1
+    assert policy.stats["retries"] == 0
+
+
+def test_retry_budget_throttles():
+    from flask_weaviate import RetryBudget, RetryPolicy
+
+    budget = RetryBudget(max_tokens=4, token_ratio=1)
+    policy = RetryPolicy(max_attempts=10, budget=budget)
+    func = flaky(10, FakeRpcError(grpc.StatusCode.UNAVAILABLE))
+
+    with pytest.raises(grpc.RpcError):
+        policy.call(func)
+    # 4 tokens, retries allowed while more than 2 are left
+    assert len(func.calls) == 2
+    assert policy.stats["throttled"] == 1
+
+    assert policy.call(lambda: "ok") == "ok"
+    assert budget.tokens == 3
+
+
+def test_retry_policy_backoff_bounds():
+    from flask_weaviate import RetryPolicy
+
+    policy = RetryPolicy(initial_backoff=0.1, max_backoff=0.3)
+    for attempt in range(5):
+        assert 0 <= policy.backoff(attempt) <= min(0.3, 0.1 * 2 ** attempt)
+
+
+def test_query_retries(app, fake_client):
+    from flask_weaviate import FlaskWeaviate, RetryBudget, RetryPolicy
+
+    app.config['WEAVIATE_RETRY_POLICY'] = RetryPolicy(budget=RetryBudget())
+    weaviate = FlaskWeaviate(app)
+    bm25 = fake_client.collections.get.return_value.query.bm25
+    bm25.side_effect = [httpx.ReadError("reset"), "result"]
+
+    assert weaviate.query("Article", "bm25", query="flask") == "result"
+    fake_client.collections.get.assert_called_with("Article")
+    bm25.assert_called_with(query="flask")
+    assert weaviate.retry_stats["retries"] == 1
+
+
+def test_retry_decorator(app):
+    from flask_weaviate import FlaskWeaviate, RetryBudget, RetryPolicy
+
+    weaviate = FlaskWeaviate(app, retry_policy=RetryPolicy(budget=RetryBudget()))
+    func = flaky(1, httpx.ConnectError("refused"))
+    decorated = weaviate.retry(func)
+
+    assert decorated() == "ok"
+    assert decorated.__name__ == "func"
+    assert weaviate.retry_stats["retries"] == 1
+
+
+def test_query_retries_failed_connect(app, fake_weaviate_client, monkeypatch):
+    from unittest import mock
+    from weaviate.exceptions import WeaviateStartUpError
+    from flask_weaviate import (
+        FlaskWeaviate,
+        RetryBudget,
+        RetryPolicy,
+        WeaviateConnectError,
+        is_transient,
+    )
+
+    connect = fake_weaviate_client.connect
+    attempts = []
+
+    def restarting(self):
+        attempts.append(self)
+        if len(attempts) == 1:
+            raise WeaviateStartUpError("Could not connect to Weaviate:reset.")
+        connect(self)
+
+    monkeypatch.setattr(fake_weaviate_client, "connect", restarting)
+    monkeypatch.setattr(
+        fake_weaviate_client, "collections", mock.MagicMock(), raising=False
+    )
+    bm25 = fake_weaviate_client.collections.get.return_value.query.bm25
+    bm25.return_value = "result"
+    weaviate = FlaskWeaviate(app, retry_policy=RetryPolicy(budget=RetryBudget()))
+
+    assert weaviate.query("Article", "bm25", query="flask") == "result"
+    assert weaviate.retry_stats["retries"] == 1
+    # the client that failed is closed and connected again
+    assert attempts[0] is attempts[1] and attempts[0].connected
+
+    too_old = WeaviateStartUpError("Weaviate version 1.22.0 is not supported.")
+    try:
+        raise WeaviateConnectError("Failed to connect to Weaviate server") from too_old
+    except WeaviateConnectError as e:
+        assert not is_transient(e)
@@ -0,0 +1,98 @@
+import base64
+import datetime
+import json
+import struct
+import uuid
+
+import pytest
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr("flask_weaviate.serialization.orjson", None)
+    return request.param
+
+
+def make_object(**properties):
+    from weaviate.collections.classes.internal import MetadataReturn, Object
+
+    return Object(
+        uuid=uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        metadata=MetadataReturn(distance=0.25),
+        properties=properties,
+        references=None,
+        vector={"default": [0.5, -1.0]},
+        collection="Article",
+    )
+
+
+def test_encode_vector():
+    from flask_weaviate import encode_vector
+
+    encoded = encode_vector([0.5, -1.0, 2.0])
+    assert struct.unpack("<3f", base64.b64decode(encoded)) == (0.5, -1.0, 2.0)
+
+
+def test_to_response(app, backend):
+    from flask_weaviate import FlaskWeaviate
+    from weaviate.collections.classes.internal import QueryReturn
+
+    weaviate = FlaskWeaviate(app)
+    created = datetime.datetime(2024, 2, 1, 12, 30, tzinfo=datetime.timezone.utc)
+    result = QueryReturn(objects=[make_object(title="Flask", created=created, body="long")])
+
+    response = weaviate.to_response(result, properties=["title", "created"])
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    obj, = json.loads(response.get_data())["objects"]
+    assert obj["uuid"] == "12345678-1234-5678-1234-567812345678"
+    assert obj["collection"] == "Article"
+    assert obj["properties"]["title"] == "Flask"
+    assert obj["properties"]["created"].startswith("2024-02-01T12:30:00")
+    assert "body" not in obj["properties"]
+    assert obj["metadata"] == {"distance": 0.25}
+    assert "vector" not in obj
+
+
+def test_to_response_vectors(app, backend):
+    from flask_weaviate import FlaskWeaviate, encode_vector
+
+    weaviate = FlaskWeaviate(app)
+
+    as_list = json.loads(weaviate.to_response(make_object(), vector="list").get_data())
+    assert as_list["vector"] == {"default": [0.5, -1.0]}
+
+    as_base64 = json.loads(weaviate.to_response(make_object(), vector="base64").get_data())
+    assert as_base64["vector"] == {"default": encode_vector([0.5, -1.0])}
+
+    with pytest.raises(ValueError):
+        weaviate.to_response(make_object(), vector="hex")
+
+
+def test_to_response_empty_and_missing(app, backend):
+    from flask_weaviate import FlaskWeaviate
+    from weaviate.collections.classes.internal import QueryReturn
+
+    weaviate = FlaskWeaviate(app)
+
+    assert json.loads(weaviate.to_response(None, status=404).get_data()) is None
+    assert json.loads(weaviate.to_response(QueryReturn(objects=[])).get_data()) == {"objects": []}
+
+
+def test_result_to_dict_groups():
+    from flask_weaviate import result_to_dict
+    from weaviate.collections.classes.internal import Group, GroupByReturn
+
+    obj = make_object(title="Flask")
+    group = Group(name="web", min_distance=0.1, max_distance=0.2,
+                  number_of_objects=1, objects=[obj], rerank_score=None)
+    data = result_to_dict(GroupByReturn(objects=[obj], groups={"web": group}),
+                          metadata=False)
+
+    assert data["groups"]["web"]["number_of_objects"] == 1
+    assert data["groups"]["web"]["objects"][0]["properties"] == {"title": "Flask"}
+    assert "metadata" not in data["objects"][0]
@@ -0,0 +1,111 @@
+from unittest.mock import MagicMock
+
+
+def test_snapshot_and_restore(tmp_path, monkeypatch):
+    from flask_weaviate.testing import EmbeddedWeaviate
+
+    instance = EmbeddedWeaviate(tmp_path / "data", tmp_path / "snapshots")
+    monkeypatch.setattr(instance, "db", MagicMock())
+    (instance.data_path / "shard").write_text("loaded")
+
+    assert not instance.has_snapshot("articles-v1")
+    instance.snapshot("articles-v1")
+    assert instance.has_snapshot("articles-v1")
+
+    (instance.data_path / "shard").write_text("changed")
+    (instance.data_path / "extra").write_text("new")
+    instance.restore("articles-v1")
+
+    assert (instance.data_path / "shard").read_text() == "loaded"
+    assert not (instance.data_path / "extra").exists()
+    # stopped and started around both the snapshot and the restore
+    assert instance.db.stop.call_count == 2
+    assert instance.db.start.call_count == 2
+
+
+class DirClient(object):
+    """
+    A client storing each collection as a directory of the data path.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.collections = self
+
+    def create(self, name):
+        (self.path / name).mkdir()
+
+    def list_all(self):
+        return {p.name: None for p in self.path.iterdir() if p.is_dir()}
+
+    def close(self):
+        pass
+
+
+def make_instance(tmp_path, monkeypatch, data):
+    from flask_weaviate.testing import EmbeddedWeaviate
+
+    instance = EmbeddedWeaviate(tmp_path / data, tmp_path / "snapshots")
+    monkeypatch.setattr(instance, "db", MagicMock())
+    monkeypatch.setattr(instance, "client", lambda: DirClient(instance.data_path))
+    return instance
+
+
+def test_load_two_datasets(tmp_path, monkeypatch):
+    loads = []
+
+    def loader(collection):
+        def load(client):
+            loads.append(collection)
+            client.collections.create(collection)
+        return load
+
+    first = make_instance(tmp_path, monkeypatch, "session-1")
+    first.load_dataset("articles-v1", loader("Article"))
+    first.load_dataset("users-v1", loader("User"))
+    first.load_dataset("articles-v1", loader("Article"))
+    assert set(first.client().collections.list_all()) == {"Article", "User"}
+    assert loads == ["Article", "User"]
+
+    # a later session restores the snapshots instead of loading again
+    second = make_instance(tmp_path, monkeypatch, "session-2")
+    second.load_dataset("articles-v1", loader("Article"))
+    second.load_dataset("users-v1", loader("User"))
+    assert set(second.client().collections.list_all()) == {"Article", "User"}
+    assert loads == ["Article", "User"]
+
+    # in another order, restoring the second dataset keeps the first
+    third = make_instance(tmp_path, monkeypatch, "session-3")
+    third.load_dataset("users-v1", loader("User"))
+    third.load_dataset("articles-v1", loader("Article"))
+    assert set(third.client().collections.list_all()) == {"Article", "User"}
+    assert third.datasets == ["articles-v1", "users-v1"]
+
+    refreshed = make_instance(tmp_path, monkeypatch, "session-4")
+    refreshed.load_dataset("articles-v1", loader("Article"), refresh=True)
+    assert loads == ["Article", "User", "User", "Article"]
+
+
+def test_namespace_cleanup():
+    from flask_weaviate.testing import Namespace
+
+    namespace = Namespace()
+    assert namespace.prefix[0].isupper()
+    assert Namespace().prefix != namespace.prefix
+
+    client = MagicMock()
+    client.collections.list_all.return_value = {
+        namespace.name("Article"): None,
+        "Article": None,
+    }
+    namespace.cleanup(client)
+    client.collections.delete.assert_called_once_with(namespace.name("Article"))
+
+
+def test_collection_prefix(app, fake_client):
+    from flask_weaviate import FlaskWeaviate
+
+    app.config["WEAVIATE_COLLECTION_PREFIX"] = "T1234_"
+    weaviate = FlaskWeaviate(app)
+    weaviate.collection("Article")
+    fake_client.collections.get.assert_called_once_with("T1234_Article")
@@ -0,0 +1,118 @@
+import logging
+
+
+def test_sanitize():
+    from flask_weaviate.timing import sanitize
+
+    assert sanitize("x" * 100, redact=False, max_length=10) == "x" * 10 + "..."
+    assert sanitize([0.1] * 384) == "<vector len=384>"
+    assert sanitize({"query": "flask", "limit": 10}, redact=False) == {
+        "query": "flask", "limit": 10
+    }
+    assert sanitize(object()) == "<object>"
+
+
+def test_sanitize_redacts_strings():
+    from flask_weaviate.timing import sanitize
+
+    redacted = sanitize({"query": "jane@example.com", "limit": 10})
+    assert redacted["limit"] == 10
+    assert redacted["query"].startswith("<str len=16 sha256=")
+    assert "jane" not in redacted["query"]
+    # equal values redact equally, so they can be correlated
+    assert sanitize(["jane@example.com"]) == [redacted["query"]]
+
+
+def test_server_timing_header():
+    from flask_weaviate.timing import server_timing_header
+
+    assert server_timing_header({}) is None
+    assert server_timing_header({"query": 0.0125, "connect": 0.002}) == (
+        "weaviate;dur=14.5, weaviate-connect;dur=2.0, weaviate-query;dur=12.5"
+    )
+
+
+def test_server_timing_response_header(app, fake_client):
+    from flask import jsonify
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app)
+
+    @app.route('/search')
+    def search_endpoint():
+        weaviate.query("Article", "bm25", query="flask")
+        with weaviate.batch("Article") as batch:
+            batch.add_object({"title": "flask"})
+        return jsonify({"result": "ok"}), 200
+
+    with app.test_client() as client:
+        response = client.get('/search')
+
+    header = response.headers["Server-Timing"]
+    assert header.startswith("weaviate;dur=")
+    assert "weaviate-query;dur=" in header
+    assert "weaviate-batch;dur=" in header
+    assert "weaviate-connect" not in header
+
+
+def test_server_timing_disabled(app, fake_client):
+    from flask import jsonify
+    from flask_weaviate import FlaskWeaviate
+
+    app.config['WEAVIATE_SERVER_TIMING'] = False
+    weaviate = FlaskWeaviate(app)
+
+    @app.route('/search')
+    def search_endpoint():
+        weaviate.query("Article", "bm25", query="flask")
+        return jsonify({"result": "ok"}), 200
+
+    with app.test_client() as client:
+        response = client.get('/search')
+
+    assert "Server-Timing" not in response.headers
+
+
+def test_slow_query_log(app, fake_client, caplog):
+    from flask_weaviate import FlaskWeaviate
+
+    app.config['WEAVIATE_SLOW_QUERY_THRESHOLD'] = 0
+    weaviate = FlaskWeaviate(app)
+
+    with caplog.at_level(logging.WARNING, logger="flask_weaviate.slow_query"):
+        weaviate.query("Article", "near_vector", [0.5] * 128, limit=5)
+
+    record = caplog.records[-1]
+    assert record.weaviate["kind"] == "query"
+    assert record.weaviate["collection"] == "Article"
+    assert record.weaviate["operation"] == "near_vector"
+    assert record.weaviate["args"] == ["<vector len=128>"]
+    assert record.weaviate["kwargs"] == {"limit": 5}
+    assert record.weaviate["duration_ms"] >= 0
+
+
+def test_slow_query_log_values(app, fake_client, caplog):
+    from flask_weaviate import FlaskWeaviate
+
+    app.config['WEAVIATE_SLOW_QUERY_THRESHOLD'] = 0
+    weaviate = FlaskWeaviate(app)
+
+    with caplog.at_level(logging.WARNING, logger="flask_weaviate.slow_query"):
+        weaviate.query("Article", "bm25", query="jane doe")
+        weaviate.log_query_values = True
+        weaviate.query("Article", "bm25", query="jane doe")
+
+    redacted, plain = caplog.records[-2:]
+    assert redacted.weaviate["kwargs"]["query"].startswith("<str len=8 ")
+    assert plain.weaviate["kwargs"] == {"query": "jane doe"}
+
+
+def test_slow_query_log_below_threshold(app, fake_client, caplog):
+    from flask_weaviate import FlaskWeaviate
+
+    weaviate = FlaskWeaviate(app, slow_query_threshold=60)
+
+    with caplog.at_level(logging.WARNING, logger="flask_weaviate.slow_query"):
+        weaviate.query("Article", "bm25", query="flask")
+
+    assert not caplog.records
@@ -0,0 +1,276 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+
+class StubTokenServer(object):
+    """
+    Serves the OIDC discovery of a Weaviate server and a token endpoint.
+    """
+
+    def __init__(self):
+        self.expires_in = 3600
+        self.fail = False
+        self.token_requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _json(self, body):
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                if self.path == "/v1/.well-known/openid-configuration":
+                    self._json({"href": f"{stub.url}/oidc", "clientId": "weaviate"})
+                elif self.path == "/oidc":
+                    self._json({"token_endpoint": f"{stub.url}/token"})
+                else:
+                    self.send_error(404)
+
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                form = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode()).items()}
+                stub.token_requests.append(form)
+                if stub.fail:
+                    self.send_error(503)
+                    return
+                n = len(stub.token_requests)
+                self._json({
+                    "access_token": f"token-{n}",
+                    "refresh_token": f"refresh-{n}",
+                    "expires_in": stub.expires_in,
+                })
+
+        self.server = HTTPServer(("127.0.0.1", 0), Handler)
+        self.port = self.server.server_address[1]
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def token_server():
+    from flask_weaviate import token_cache
+
+    server = StubTokenServer()
+    token_cache.clear()
+    yield server
+    token_cache.clear()
+    server.stop()
+
+
+def test_oidc_token_source_password(token_server):
+    from flask_weaviate import OidcTokenSource
+    from weaviate.auth import Auth
+
+    source = OidcTokenSource(
+        token_server.url, Auth.client_password("user", "secret", scope="offline_access")
+    )
+    assert source.fetch()["access_token"] == "token-1"
+    assert source.fetch(refresh_token="refresh-1")["access_token"] == "token-2"
+
+    password, refresh = token_server.token_requests
+    assert password == {"client_id": "weaviate", "grant_type": "password",
+                        "username": "user", "password": "secret",
+                        "scope": "offline_access"}
+    assert refresh == {"client_id": "weaviate", "grant_type": "refresh_token",
+                       "refresh_token": "refresh-1"}
+
+
+def test_oidc_token_source_client_credentials(token_server):
+    from flask_weaviate import OidcTokenSource
+    from weaviate.auth import Auth
+
+    source = OidcTokenSource(token_server.url, Auth.client_credentials("s3cr3t", scope="api"))
+    source.fetch()
+
+    assert token_server.token_requests[0]["grant_type"] == "client_credentials"
+    assert token_server.token_requests[0]["client_secret"] == "s3cr3t"
+
+    with pytest.raises(ValueError):
+        OidcTokenSource(token_server.url, Auth.api_key("key"))
+
+
+def test_token_cache_shares_tokens(token_server):
+    from flask_weaviate import OidcTokenSource, TokenCache
+    from weaviate.auth import Auth
+
+    cache = TokenCache()
+    source = OidcTokenSource(token_server.url, Auth.client_password("user", "secret"))
+
+    tokens = [cache.access_token("key", source) for _ in range(5)]
+
+    assert tokens == ["token-1"] * 5
+    assert len(token_server.token_requests) == 1
+
+
+def test_token_cache_refreshes_in_background(token_server):
+    from flask_weaviate import OidcTokenSource, TokenCache
+    from weaviate.auth import Auth
+
+    token_server.expires_in = 2
+    cache = TokenCache(refresh_margin=1.5)
+    source = OidcTokenSource(token_server.url, Auth.client_password("user", "secret"))
+
+    assert cache.access_token("key", source) == "token-1"
+    deadline = time.monotonic() + 5
+    while cache.access_token("key", source) == "token-1" and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    # refreshed before the first token expired, with its refresh token
+    assert cache.access_token("key", source) == "token-2"
+    assert token_server.token_requests[1]["refresh_token"] == "refresh-1"
+
+
+def test_token_cache_backs_off_failures(token_server):
+    from flask_weaviate import OidcTokenSource, TokenCache, TokenUnavailableError
+    from weaviate.auth import Auth
+
+    token_server.fail = True
+    cache = TokenCache(min_backoff=0.2, max_backoff=10)
+    source = OidcTokenSource(token_server.url, Auth.client_password("user", "secret"))
+
+    with pytest.raises(httpx.HTTPError):
+        cache.access_token("key", source)
+    # the failure is cached, the identity provider is not asked again
+    for _ in range(5):
+        with pytest.raises(TokenUnavailableError):
+            cache.access_token("key", source)
+    assert len(token_server.token_requests) == 1
+
+    time.sleep(0.25)
+    with pytest.raises(httpx.HTTPError):
+        cache.access_token("key", source)
+    # the backoff doubles with every failure
+    assert cache._retry_at["key"] - time.monotonic() > 0.3
+
+    token_server.fail = False
+    cache._retry_at["key"] = 0
+    assert cache.access_token("key", source) == "token-3"
+    assert "key" not in cache._failures
+
+
+def test_token_cache_evicts_unused_tokens(token_server, monkeypatch):
+    from flask_weaviate import OidcTokenSource, TokenCache
+    from weaviate.auth import Auth
+
+    now = [100.0]
+    monkeypatch.setattr("flask_weaviate.tokens.time.monotonic", lambda: now[0])
+    monkeypatch.setattr(TokenCache, "_start_refresher", lambda self: None)
+    cache = TokenCache(refresh_margin=30)
+    source = OidcTokenSource(token_server.url, Auth.client_password("user", "secret"))
+    cache.access_token("key", source)
+
+    # requested since it was fetched: refreshed when due
+    now[0] += 3571
+    cache._refresh_once()
+    assert len(token_server.token_requests) == 2
+
+    # not requested since: left to expire, then dropped
+    now[0] += 3571
+    cache._refresh_once()
+    assert len(token_server.token_requests) == 2
+    now[0] += 30
+    cache._refresh_once()
+    assert cache._tokens == {} and cache._sources == {} and cache._used == {}
+
+
+def test_credentials_key_hides_secret():
+    from flask_weaviate import credentials_key
+    from weaviate.auth import Auth
+
+    url, digest = credentials_key("http://weaviate", Auth.client_password("user", "s3cr3t"))
+    assert url == "http://weaviate"
+    assert "s3cr3t" not in digest
+    assert digest != credentials_key(
+        "http://weaviate", Auth.client_password("user", "other")
+    )[1]
+
+
+def test_clients_share_token(app, fake_weaviate_client, token_server):
+    from flask_weaviate import FlaskWeaviate
+
+    app.config['WEAVIATE_HTTP_HOST'] = "127.0.0.1"
+    app.config['WEAVIATE_HTTP_PORT'] = token_server.port
+    app.config['WEAVIATE_USERNAME'] = "user"
+    app.config['WEAVIATE_PASSWORD'] = "secret"
+    app.config['WEAVIATE_ADDITIONAL_HEADERS'] = {"X-OpenAI-Api-Key": "key"}
+    weaviate = FlaskWeaviate(app)
+
+    for _ in range(3):
+        with app.app_context():
+            weaviate.client
+
+    assert len(token_server.token_requests) == 1
+    for client in fake_weaviate_client.instances:
+        assert client.kwargs["auth_client_secret"] is None
+        assert client.kwargs["additional_headers"] == {
+            "X-OpenAI-Api-Key": "key", "authorization": "Bearer token-1"
+        }
+
+
+def test_clients_authenticate_themselves_when_token_fails(app, fake_weaviate_client):
+    from flask_weaviate import FlaskWeaviate
+    from weaviate.auth import Auth
+
+    app.config['WEAVIATE_HTTP_HOST'] = "127.0.0.1"
+    app.config['WEAVIATE_HTTP_PORT'] = 1
+    app.config['WEAVIATE_USERNAME'] = "user"
+    app.config['WEAVIATE_PASSWORD'] = "secret"
+    weaviate = FlaskWeaviate(app)
+
+    weaviate.client
+
+    client, = fake_weaviate_client.instances
+    assert client.kwargs["auth_client_secret"] == Auth.client_password("user", "secret")
+
+
+def test_clients_do_not_refetch_failing_token(app, fake_weaviate_client, token_server):
+    from flask_weaviate import FlaskWeaviate
+
+    token_server.fail = True
+    app.config['WEAVIATE_HTTP_HOST'] = "127.0.0.1"
+    app.config['WEAVIATE_HTTP_PORT'] = token_server.port
+    app.config['WEAVIATE_USERNAME'] = "user"
+    app.config['WEAVIATE_PASSWORD'] = "secret"
+    weaviate = FlaskWeaviate(app)
+
+    for _ in range(3):
+        with app.app_context():
+            weaviate.client
+
+    assert len(token_server.token_requests) == 1
+    for client in fake_weaviate_client.instances:
+        assert client.kwargs["auth_client_secret"] is not None
+
+
+def test_share_tokens_disabled(app, fake_weaviate_client, token_server):
+    from flask_weaviate import FlaskWeaviate
+
+    app.config['WEAVIATE_HTTP_HOST'] = "127.0.0.1"
+    app.config['WEAVIATE_HTTP_PORT'] = token_server.port
+    app.config['WEAVIATE_USERNAME'] = "user"
+    app.config['WEAVIATE_PASSWORD'] = "secret"
+    app.config['WEAVIATE_SHARE_TOKENS'] = False
+    weaviate = FlaskWeaviate(app)
+
+    weaviate.client
+
+    assert not token_server.token_requests
+    assert fake_weaviate_client.instances[0].kwargs["auth_client_secret"] is not None
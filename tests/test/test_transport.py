@@ -0,0 +1,124 @@
+import time
+from types import SimpleNamespace
+
+import httpx
+
+
+class FakeGrpcMethod(object):
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, request, timeout=None):
+        self.calls.append(timeout)
+        return "reply"
+
+    def with_call(self, request, timeout=None):
+        self.calls.append(timeout)
+        return "reply", None
+
+
+def make_client():
+    """
+    A stand-in for a connected client with the transport internals of
+    weaviate-client: an httpx session and a gRPC stub.
+    """
+    session = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    )
+    stub = SimpleNamespace(Search=FakeGrpcMethod(), BatchObjects=FakeGrpcMethod())
+    return SimpleNamespace(_connection=SimpleNamespace(_client=session, _grpc_stub=stub))
+
+
+def test_instrument_client_times_direct_calls(app):
+    from flask_weaviate import FlaskWeaviate, get_timings
+    from flask_weaviate.transport import instrument_client
+
+    weaviate = FlaskWeaviate(app)
+    client = make_client()
+    instrument_client(client, weaviate._transport_call)
+    # instrumenting twice does not wrap twice
+    instrument_client(client, weaviate._transport_call)
+
+    client._connection._client.get("http://weaviate/v1/schema")
+    assert client._connection._grpc_stub.Search.with_call(
+        SimpleNamespace(collection="Article"), timeout=30
+    ) == ("reply", None)
+    client._connection._grpc_stub.BatchObjects(SimpleNamespace())
+
+    timings = get_timings()
+    assert set(timings) == {"query", "batch"}
+
+
+def test_instrument_client_slow_query_log(app, caplog):
+    import logging
+    from flask_weaviate import FlaskWeaviate
+    from flask_weaviate.transport import instrument_client
+
+    weaviate = FlaskWeaviate(app, slow_query_threshold=0)
+    client = make_client()
+    instrument_client(client, weaviate._transport_call)
+
+    with caplog.at_level(logging.WARNING, logger="flask_weaviate.slow_query"):
+        client._connection._grpc_stub.Search.with_call(
+            SimpleNamespace(collection="Article")
+        )
+        client._connection._client.get("http://weaviate/v1/schema?secret=1")
+
+    search, rest = caplog.records[-2:]
+    assert (search.weaviate["collection"], search.weaviate["operation"]) == (
+        "Article", "Search"
+    )
+    # the query string is left out
+    assert rest.weaviate["operation"] == "GET /v1/schema"
+
+
+def test_instrument_client_not_counted_twice(app):
+    from flask_weaviate import FlaskWeaviate, get_timings
+    from flask_weaviate.transport import instrument_client
+
+    weaviate = FlaskWeaviate(app, slow_query_threshold=0)
+    client = make_client()
+    instrument_client(client, weaviate._transport_call)
+
+    with weaviate.timed("batch", "Article", "insert"):
+        client._connection._grpc_stub.Search(SimpleNamespace(collection="Article"))
+
+    assert set(get_timings()) == {"batch"}
+
+
+def test_deadline_caps_timeouts(app):
+    from flask_weaviate import FlaskWeaviate
+    from flask_weaviate.transport import (
+        EXPIRED_TIMEOUT,
+        deadline,
+        instrument_client,
+        remaining,
+    )
+
+    weaviate = FlaskWeaviate(app)
+    client = make_client()
+    seen = []
+    client._connection._client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: seen.append(request.extensions["timeout"])
+            or httpx.Response(200)
+        )
+    )
+    instrument_client(client, weaviate._transport_call)
+    search = client._connection._grpc_stub.Search
+
+    assert remaining() is None
+    with deadline(time.monotonic() + 1):
+        search.with_call(SimpleNamespace(), timeout=30)
+        client._connection._client.get("http://weaviate/v1/schema")
+        with deadline(time.monotonic() + 60):
+            # a nested deadline does not extend the outer one
+            assert remaining() <= 1
+    with deadline(time.monotonic() - 1):
+        search(SimpleNamespace(), timeout=30)
+    search(SimpleNamespace(), timeout=30)
+
+    assert 0 < search.method.calls[0] <= 1
+    assert 0 < seen[0]["read"] <= 1
+    assert search.method.calls[1] == EXPIRED_TIMEOUT
+    assert search.method.calls[2] == 30